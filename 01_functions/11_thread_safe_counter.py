@@ -0,0 +1,272 @@
+"""
+THREAD-SAFE ORDER COUNTING (beyond 'global' and 'nonlocal')
+
+In 05_nonlocal_vs_global.py the tea shop tracks stock like this:
+
+    chai_stock = 100                 # global
+    def take_order():
+        nonlocal chai_orders
+        global chai_stock
+        chai_orders += 1
+        chai_stock -= 1
+
+That works for ONE person taking orders. But `chai_stock -= 1` is really
+three steps (read, subtract, write back), so when many threads take orders
+at once, two of them can read the same value and one order gets "lost".
+
+The usual fix is a Lock around every order - correct, but now every single
+order waits in the same queue. This file shows a better shape:
+
+1. SHARDS:   every worker thread counts into its OWN counter (no waiting)
+2. BATCHES:  a thread reserves a block of cups at once, so it only touches
+             the shared stock once per block, not once per cup
+3. MERGE ON READ: totals are added up only when someone asks for them
+4. STEALING: when the shared stock is empty, cups other threads reserved
+             but never sold are taken back, so "sold out" really means it
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from itertools import repeat
+
+# ============================================================================
+# The naive version: one Lock around one shared number
+# ============================================================================
+
+class LockedCounter:
+    """Correct but serialized: every order takes the same lock"""
+
+    def __init__(self, stock):
+        self._lock = threading.Lock()
+        self.stock = stock
+        self.orders = 0
+
+    def take_order(self):
+        with self._lock:
+            if self.stock == 0:
+                return False
+            self.stock -= 1
+            self.orders += 1
+            return True
+
+    def worker(self):
+        """Nothing is held per thread, so there is nothing to clean up"""
+        return nullcontext(self)
+
+
+# ============================================================================
+# The sharded version: per-thread shards + batched reservations
+# ============================================================================
+
+class _Shard:
+    """One thread's tally. Reserved cups sit in a deque: pop() and popleft()
+    are atomic in CPython, so the owner sells from the right while another
+    thread may steal from the left - without any lock"""
+    __slots__ = ("orders", "cups")
+
+    def __init__(self):
+        self.orders = 0      # orders this thread has taken (only it writes here)
+        self.cups = deque()  # one entry per cup reserved but not sold yet
+
+
+def _drain(cups, n):
+    """Take up to n cups from the LEFT of a shard's deque; returns how many"""
+    taken = 0
+    try:
+        while taken < n:
+            cups.popleft()
+            taken += 1
+    except IndexError:       # the owner sold the rest meanwhile
+        pass
+    return taken
+
+
+class ShardedCounter:
+    """
+    Stock is split into:
+    - self._stock:     cups nobody has reserved yet (shared, needs the lock)
+    - shard.cups:      cups a thread has set aside for itself (no lock needed)
+
+    reserve() / commit() / release() are the atomic API; take_order() is
+    the everyday shortcut built on top of them. Wrap each worker thread's
+    loop in `with counter.worker():` so its leftover cups go back when done.
+    """
+
+    # Reserved cups are held one deque entry each (8 bytes), so a reservation
+    # is meant to be batch-sized; bigger requests are granted only this many
+    MAX_RESERVE = 1 << 16
+
+    def __init__(self, stock, batch_size=64):
+        self._lock = threading.Lock()
+        self._stock = stock
+        self._local = threading.local()
+        self._shards = []            # every shard ever created, for merging
+        self.batch_size = batch_size
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _Shard()
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def reserve(self, cups):
+        """Atomically move up to `cups` (at most MAX_RESERVE) from shared
+        stock to this thread; returns how many were granted"""
+        if cups < 0:
+            raise ValueError(f"Cannot reserve {cups} cups")
+        with self._lock:
+            granted = min(cups, self._stock, self.MAX_RESERVE)
+            self._stock -= granted
+        self._shard().cups.extend(repeat(None, granted))
+        return granted
+
+    def commit(self, cups=1):
+        """Turn `cups` of this thread's reservation into sold orders"""
+        if cups < 1:
+            raise ValueError(f"Cannot commit {cups} cups")
+        shard = self._shard()
+        for taken in range(cups):
+            try:
+                shard.cups.pop()
+            except IndexError:
+                shard.cups.extend(repeat(None, taken))   # put back, all or nothing
+                raise ValueError(f"Only {taken} cups reserved, cannot commit {cups}") from None
+        shard.orders += cups
+
+    def release(self):
+        """Give this thread's unsold reservation back to the shared stock"""
+        cups = self._shard().cups
+        leftover = _drain(cups, len(cups))
+        with self._lock:
+            self._stock += leftover
+        return leftover
+
+    @contextmanager
+    def worker(self):
+        """with counter.worker(): ... - releases this thread's leftover cups on exit"""
+        try:
+            yield self
+        finally:
+            self.release()
+
+    def take_order(self):
+        shard = self._shard()
+        while True:
+            try:
+                shard.cups.pop()
+            except IndexError:
+                # Nothing reserved (or it was just stolen): refill, then retry
+                if not self.reserve(self.batch_size):
+                    return self._steal_order(shard)
+                continue
+            shard.orders += 1
+            return True
+
+    def _steal_order(self, shard):
+        """Shared stock is empty: take half of another shard's unsold cups
+        (e.g. from a thread that exited without release()) and sell one"""
+        with self._lock:
+            others = [other for other in self._shards if other is not shard]
+        for other in others:
+            taken = _drain(other.cups, (len(other.cups) + 1) // 2)
+            if taken:
+                shard.cups.extend(repeat(None, taken - 1))
+                shard.orders += 1
+                return True
+        return False                 # shop is really sold out
+
+    @property
+    def orders(self):
+        with self._lock:
+            shards = list(self._shards)
+        return sum(shard.orders for shard in shards)
+
+    @property
+    def stock(self):
+        """Unsold cups = unreserved stock + everything sitting in shards"""
+        with self._lock:
+            return self._stock + sum(len(shard.cups) for shard in self._shards)
+
+
+# ============================================================================
+# tea_shop() rebuilt on the counter
+# ============================================================================
+
+def tea_shop(counter, workers, orders_per_worker):
+    """Several workers take orders at the same time"""
+
+    def worker():
+        taken = 0
+        with counter.worker():       # hands back cups we did not sell
+            for _ in range(orders_per_worker):
+                if counter.take_order():
+                    taken += 1
+        return taken
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(worker) for _ in range(workers)]
+        return sum(f.result() for f in futures)
+
+
+print("=== TEA SHOP with 4 workers ===")
+shop = ShardedCounter(stock=200, batch_size=8)
+sold = tea_shop(shop, workers=4, orders_per_worker=40)
+print(f"Orders taken: {shop.orders}, Sold: {sold}, Stock left: {shop.stock}")  # 160, 160, 40
+
+print("\n=== Reserve / commit / release ===")
+shop = ShardedCounter(stock=10)
+print("Reserved:", shop.reserve(3))         # 3
+shop.commit(2)                               # sell two of them
+print("Released:", shop.release())          # 1 goes back
+print(f"Orders: {shop.orders}, Stock: {shop.stock}")  # 2, 8
+try:
+    shop.commit(-5)                          # would quietly lower the order count
+except ValueError as error:
+    print("ValueError:", error)
+
+print("\n=== A worker that leaves without release() ===")
+shop = ShardedCounter(stock=10, batch_size=8)
+careless = threading.Thread(target=shop.take_order)  # reserves 8, sells 1, exits
+careless.start()
+careless.join()
+print([shop.take_order() for _ in range(10)])  # 9 x True (2 fresh + 7 stolen), then False
+print(f"Orders: {shop.orders}, Stock: {shop.stock}")  # 10, 0
+
+
+# ============================================================================
+# Benchmark: orders/sec from 1 to N worker threads
+# ============================================================================
+
+def benchmark(total_orders=200_000):
+    print("\n=== Benchmark: orders/sec ===")
+    for workers in (1, 2, 4, 8):
+        per_worker = total_orders // workers
+        stock = total_orders * 2     # enough that nobody runs out mid-run
+        for name, counter in (("locked ", LockedCounter(stock)),
+                              ("sharded", ShardedCounter(stock))):
+            start = time.perf_counter()
+            tea_shop(counter, workers, per_worker)
+            elapsed = time.perf_counter() - start
+            assert counter.orders == per_worker * workers
+            print(f"{workers} workers, {name}: {per_worker * workers / elapsed:>12,.0f} orders/sec")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- `x -= 1` on a shared variable is NOT atomic - threads can lose updates
+- A single Lock fixes correctness but makes every order wait in one line
+- Sharding: give each thread its own counter, add them up only when reading
+- Batching: grab many cups at once so the shared lock is rare
+- Reserved-but-unsold cups must come back: release() when a worker is
+  done, and steal from other shards before saying "sold out"
+- With CPython's GIL, pure-Python threads still run one at a time, so the
+  numbers show less lock traffic rather than perfect scaling across cores
+"""
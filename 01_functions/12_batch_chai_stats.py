@@ -0,0 +1,169 @@
+"""
+BATCH (VECTORIZED) VERSION OF calculate_chai_stats
+
+In 07_return.py we wrote:
+
+    def calculate_chai_stats(total_made, cups_sold):
+        remaining = total_made - cups_sold
+        revenue = cups_sold * 50
+        percentage_sold = (cups_sold / total_made) * 100
+        return remaining, revenue, percentage_sold
+
+Great for ONE shop. But calling it a million times (every shop, every day)
+means a million Python function calls and a million tuples.
+
+Batch idea: pass in whole COLUMNS (one for total_made, one for cups_sold)
+and get back whole columns (remaining, revenue, percentage_sold).
+- With NumPy installed: each column is computed in ONE C-level loop
+- Without NumPy: we fall back to array.array columns (compact, stdlib only)
+
+Both paths give percentage_sold = nan where total_made is 0 (no division
+error, no warning), so one empty shop never aborts the whole batch.
+"""
+
+import math
+import time
+from array import array
+from itertools import repeat
+from operator import mul, sub, truediv
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - the stdlib path below still works
+    np = None
+
+PRICE_PER_CUP = 50
+
+# ============================================================================
+# The batch function: columns in, columns out
+# ============================================================================
+
+def _column(func, *columns):
+    """Whole-number results go in an int64 column; as soon as one value is a
+    float, array("q") refuses it (TypeError) and we redo it as float64.
+    Values too big for either (OverflowError) stay exact in a plain list."""
+    try:
+        return array("q", map(func, *columns))
+    except TypeError:
+        try:
+            return array("d", map(func, *columns))
+        except OverflowError:
+            pass
+    except OverflowError:
+        pass
+    return list(map(func, *columns))
+
+
+def _percent(sold, made):
+    return sold / made * 100 if made else math.nan
+
+
+def _percent_column(cups_sold, total_made):
+    try:
+        # The fast path: the whole column in C, no Python call per row
+        return array("d", map(mul, map(truediv, cups_sold, total_made), repeat(100)))
+    except ZeroDivisionError:
+        return array("d", map(_percent, cups_sold, total_made))
+
+
+def calculate_chai_stats_batch(total_made, cups_sold):
+    """
+    total_made, cups_sold: NumPy arrays, array.array columns or plain lists
+    (same length). Returns three columns:
+        remaining, revenue, percentage_sold
+    """
+    if np is not None:
+        total_made = np.asarray(total_made)
+        cups_sold = np.asarray(cups_sold)
+        remaining = total_made - cups_sold
+        revenue = cups_sold * PRICE_PER_CUP
+        percentage_sold = np.full(np.shape(total_made), np.nan)
+        np.divide(cups_sold, total_made, out=percentage_sold, where=total_made != 0,
+                  casting="unsafe")                # object columns (huge ints) too
+        percentage_sold *= 100
+        return remaining, revenue, percentage_sold
+
+    # Stdlib fallback: map() + operator functions keep each column's loop in C
+    remaining = _column(sub, total_made, cups_sold)
+    revenue = _column(mul, cups_sold, repeat(PRICE_PER_CUP))
+    percentage_sold = _percent_column(cups_sold, total_made)
+    return remaining, revenue, percentage_sold
+
+
+# ============================================================================
+# The scalar function is now a thin wrapper around the batch one
+# ============================================================================
+
+def calculate_chai_stats(total_made, cups_sold):
+    """Same signature and results as in 07_return.py (ints stay ints, floats
+    stay floats), except total_made == 0 gives nan like the batch version"""
+    columns = calculate_chai_stats_batch([total_made], [cups_sold])
+    # .item() turns NumPy values back into plain Python numbers
+    return tuple(value.item() if hasattr(value, "item") else value
+                 for value in (column[0] for column in columns))
+
+
+cups_left, money_earned, sold_percent = calculate_chai_stats(100, 75)
+print("=== Single shop (same as before) ===")
+print(f"Cups remaining: {cups_left}")        # 25
+print(f"Revenue earned: ₹{money_earned}")    # 3750
+print(f"Percentage sold: {sold_percent}%")   # 75.0
+print(calculate_chai_stats(10.5, 2))         # (8.5, 100, 19.047...) - floats work too
+print(calculate_chai_stats(10**20, 1))       # (99999999999999999999, 50, 9.99...e-19) - exact big ints
+print(calculate_chai_stats(0, 0))            # (0, 0, nan) - an empty shop, not an error
+
+print("\n=== Three shops in one call ===")
+made = array("q", [100, 200, 0])
+sold = array("q", [75, 150, 0])
+remaining, revenue, percent = calculate_chai_stats_batch(made, sold)
+print("Remaining:", list(remaining))         # [25, 50, 0]
+print("Revenue:  ", list(revenue))           # [3750, 7500, 0]
+print("Percent:  ", list(percent))           # [75.0, 75.0, nan] - the closed shop doesn't stop the batch
+
+
+# ============================================================================
+# Benchmark: one call per row vs. one call per column
+# ============================================================================
+
+def _scalar_stats(total_made, cups_sold):
+    # The original pure-Python version, used as the baseline
+    return total_made - cups_sold, cups_sold * PRICE_PER_CUP, (cups_sold / total_made) * 100
+
+
+def benchmark(rows=1_000_000):
+    # Try rows=10**7 or 10**8 (with NumPy) for the nightly-sized numbers
+    made = array("q", [100 + i % 50 for i in range(rows)])
+    sold = array("q", [i % 100 for i in range(rows)])
+    if np is not None:
+        made, sold = np.frombuffer(made, dtype=np.int64), np.frombuffer(sold, dtype=np.int64)
+
+    start = time.perf_counter()
+    results = [_scalar_stats(m, s) for m, s in zip(made, sold)]
+    scalar_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculate_chai_stats_batch(made, sold)
+    batch_time = time.perf_counter() - start
+
+    engine = "NumPy" if np is not None else "array.array"
+    print(f"\n=== Benchmark: {rows:,} shops ({engine}) ===")
+    print(f"Scalar loop: {scalar_time:.3f}s")
+    print(f"Batch:       {batch_time:.3f}s  (speedup: {scalar_time / batch_time:.1f}x)")
+    del results
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Per-row function calls cost more than the arithmetic inside them
+- Batch APIs take and return COLUMNS, so the loop runs in C (NumPy) or in
+  map() + operator functions instead of a Python call per row
+- Without NumPy the speedup is small; the bigger win is memory: three
+  compact columns instead of a million little tuples
+- Keep the simple scalar function as a wrapper so old callers don't break
+- array.array stores numbers compactly (8 bytes each) without NumPy;
+  values it can't hold (huge ints) fall back to a plain list, never an error
+- Decide what a bad row (total_made == 0) gives, and make every backend do
+  the same: here nan, so one row can't abort the whole batch
+"""
@@ -0,0 +1,134 @@
+"""
+FROM RECURSION TO LOOPS: pour_chai for millions of cups
+
+09_recursion.py counts down like this:
+
+    def pour_chai(n):
+        print(n)
+        if n == 0:
+            return
+        pour_chai(n - 1)
+
+Two problems when n gets big:
+1. Every call adds a frame to the call stack. Python stops at about 1000
+   frames (sys.getrecursionlimit()) -> RecursionError.
+2. print() once per number means one write to the terminal per number,
+   and that I/O is slower than the counting itself.
+
+Fixes shown here:
+- an explicit LOOP (no stack growth at all)
+- a TRAMPOLINE (keep the recursive shape, but return "the next step"
+  instead of calling it, and let a loop run the steps)
+- BUFFERED output: collect many lines, write them in one go
+- a GENERATOR mode so callers can pull the countdown lazily
+"""
+
+import io
+import os
+import sys
+import time
+
+# ============================================================================
+# 1. The original, for comparison
+# ============================================================================
+
+def pour_chai_recursive(n, out=None):          # print(file=None) -> the current sys.stdout
+    print(n, file=out)
+    if n == 0:
+        return
+    pour_chai_recursive(n - 1, out)
+
+
+try:
+    pour_chai_recursive(5000, out=io.StringIO())
+except RecursionError:
+    print(f"Recursive pour_chai(5000): RecursionError (limit is {sys.getrecursionlimit()})")
+
+
+# ============================================================================
+# 2. Generator mode: lazy countdown, no printing at all
+# ============================================================================
+
+def countdown(n):
+    """Yields n, n-1, ..., 0 one at a time"""
+    while n >= 0:
+        yield n
+        n -= 1
+
+
+# ============================================================================
+# 3. Iterative + buffered: one write per block instead of per line
+# ============================================================================
+
+def pour_chai(n, out=None, block_size=10_000):
+    """Same output as the recursive version, for any n"""
+    out = out if out is not None else sys.stdout   # looked up per call, so redirects work
+    buffer = []
+    for cup in countdown(n):
+        buffer.append(str(cup))
+        if len(buffer) == block_size:
+            out.write("\n".join(buffer) + "\n")   # ONE write for the whole block
+            buffer.clear()
+    if buffer:
+        out.write("\n".join(buffer) + "\n")
+
+
+# ============================================================================
+# 4. Trampoline: recursive style, loop execution
+# ============================================================================
+
+def trampoline(step, *args):
+    """Keep calling whatever function the last step handed back"""
+    result = step(*args)
+    while callable(result):
+        result = result()
+    return result
+
+
+def pour_chai_step(n, poured=0):
+    # Instead of calling itself, it RETURNS a function that does the next step
+    if n < 0:
+        return poured
+    return lambda: pour_chai_step(n - 1, poured + 1)
+
+
+print("\n=== Iterative pour_chai(5) ===")
+pour_chai(5)                                      # 5 4 3 2 1 0, same as before
+
+print("\n=== Generator mode ===")
+print("First 3 of a million:", [cup for cup, _ in zip(countdown(1_000_000), range(3))])
+
+print("\n=== Trampoline ===")
+print("Cups poured for n=100_000:", trampoline(pour_chai_step, 100_000))  # 100001
+
+
+# ============================================================================
+# Benchmark: print per step vs. buffered blocks
+# ============================================================================
+
+def benchmark(n=2_000_000):
+    print(f"\n=== Benchmark: countdown from {n:,} to {os.devnull} ===")
+    with open(os.devnull, "w") as devnull:
+        start = time.perf_counter()
+        for cup in countdown(n):
+            print(cup, file=devnull)              # one print per number
+        print_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pour_chai(n, out=devnull)
+        buffered_time = time.perf_counter() - start
+
+    print(f"print() per step: {print_time:.2f}s ({n / print_time:>12,.0f} cups/sec)")
+    print(f"Buffered blocks:  {buffered_time:.2f}s ({n / buffered_time:>12,.0f} cups/sec)")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Each recursive call uses a stack frame; Python caps them (~1000 by default)
+- Simple "call myself with n-1" recursion is just a loop in disguise
+- A trampoline keeps the recursive style but runs in constant stack space
+- Writing in big blocks beats many tiny writes
+- A generator lets the caller decide how much of the countdown to use
+"""
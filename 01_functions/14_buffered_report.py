@@ -0,0 +1,247 @@
+"""
+BUFFERED REPORT WRITER - fewer, bigger writes
+
+Functions in 06_args_kwargs_explained.py and 01_duplication.py print one
+line (sometimes one WORD) at a time:
+
+    def make_pizza(*toppings, **options):
+        print("Making a pizza with the following toppings:")
+        for topping in toppings:
+            print(f"  - {topping}")
+        ...
+
+Every print() is a separate write to the output. When thousands of
+reports are produced, those small writes cost more than building the text.
+
+ReportWriter keeps the same print()-style call, but collects text in an
+in-memory buffer (io.StringIO) and writes it out in large blocks.
+
+The lesson files keep their originals; the copies below take an optional
+report= writer and still print line by line when none is given.
+"""
+
+import asyncio
+import io
+import os
+import sys
+import time
+
+# ============================================================================
+# The writer
+# ============================================================================
+
+class LineWriter:
+    """print() per line behind the same .print() call - the default report"""
+
+    def __init__(self, out=None, flush=False):
+        self.out = out                         # None -> sys.stdout at call time
+        self.flush_each = flush
+
+    def print(self, *values, sep=" ", end="\n"):
+        print(*values, sep=sep, end=end, file=self.out, flush=self.flush_each)
+
+
+LINES = LineWriter()
+
+
+class ReportWriter:
+    """
+    report = ReportWriter()
+    report.print("Ingredients:", ingredients)   # same arguments as print()
+    report.flush()                              # or use it as a `with` block
+    """
+
+    def __init__(self, out=None, flush_at=64 * 1024):
+        self.out = out if out is not None else sys.stdout
+        self.flush_at = flush_at               # characters buffered before a write
+        self._buffer = io.StringIO()
+
+    def print(self, *values, sep=" ", end="\n"):
+        self._buffer.write(sep.join(map(str, values)) + end)
+        if self._buffer.tell() >= self.flush_at:
+            self.flush()
+
+    def _take(self):
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+    def flush(self):
+        text = self._take()
+        if text:
+            self.out.write(text)               # ONE write for the whole block
+            self.out.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.flush()
+
+
+class AsyncReportWriter(ReportWriter):
+    """Same buffering, but the big write happens in a worker thread so the
+    event loop keeps serving other orders while the block is written.
+    Use it with `async with`; a plain `with` can't await the last flush."""
+
+    def __init__(self, out=None, flush_at=64 * 1024):
+        super().__init__(out, flush_at)
+        self._write_lock = asyncio.Lock()      # blocks are written in order
+        self._pending = set()                  # flushes started by print()
+        self._scheduled = False                # one started, hasn't taken the text yet
+
+    def print(self, *values, sep=" ", end="\n"):
+        self._buffer.write(sep.join(map(str, values)) + end)
+        if self._buffer.tell() >= self.flush_at and not self._scheduled:
+            # Never block inside print(): start the flush, don't wait for it
+            try:
+                task = asyncio.get_running_loop().create_task(self.flush())
+            except RuntimeError:               # no event loop yet - keep buffering
+                return
+            self._scheduled = True
+            self._pending.add(task)
+            task.add_done_callback(self._pending.discard)
+
+    async def flush(self):
+        self._scheduled = False
+        text = self._take()                    # taken in print() order...
+        if text:
+            async with self._write_lock:       # ...and the lock is first come, first served
+                await asyncio.to_thread(self._write, text)
+
+    def _write(self, text):
+        self.out.write(text)
+        self.out.flush()
+
+    def __enter__(self):
+        raise TypeError("AsyncReportWriter needs 'async with', not 'with'")
+
+    def __exit__(self, *exc):
+        pass                                   # never reached: __enter__ refuses
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._pending:
+            await asyncio.gather(*self._pending)
+        await self.flush()
+
+
+# ============================================================================
+# The reporting functions, ported to the writer
+# ============================================================================
+# Only change: print(...) -> report.print(...), with report=None meaning
+# "print each line right away", exactly like the originals
+
+def print_order(name, chai_type, report=None):
+    report = report if report is not None else LINES
+    report.print(f"{name} ordered {chai_type} chai.")
+
+
+def special_chai(*ingredients, report=None, **extras):
+    report = report if report is not None else LINES
+    report.print("Ingredients:", ingredients)
+    report.print("Extras:", extras)
+    report.print()
+
+
+def make_pizza(*toppings, report=None, **options):
+    report = report if report is not None else LINES
+    report.print("Making a pizza with the following toppings:")
+    for topping in toppings:
+        report.print(f"  - {topping}")
+
+    report.print("\nPizza options:")
+    for option, value in options.items():
+        report.print(f"  {option}: {value}")
+    report.print()
+
+
+def user_profile(username, *interests, report=None, **details):
+    report = report if report is not None else LINES
+    report.print(f"Username: {username}")
+
+    report.print("Interests:", end=" ")
+    for interest in interests:
+        report.print(interest, end=" ")
+    report.print()
+
+    report.print("Additional details:")
+    for key, value in details.items():
+        report.print(f"  {key}: {value}")
+    report.print()
+
+
+print_order('Sita', 'Masala')                  # no report: printed right away, as before
+
+with ReportWriter() as report:
+    print_order('Ram', 'Tulsi', report=report)
+    special_chai("Cinnamon", "Cardmom", report=report, sweetener="Honey", foam="yes")
+    make_pizza("pepperoni", "mushrooms", report=report, size="large", crust="thin")
+    user_profile("john_doe", "coding", "gaming", report=report, age=28, location="California")
+# <- everything above reached the terminal in a single write here
+
+
+async def async_demo():
+    async with AsyncReportWriter() as report:
+        for name in ("Asha", "Vikram"):
+            print_order(name, "Masala", report=report)
+            await asyncio.sleep(0)             # other tasks could run here
+
+asyncio.run(async_demo())
+
+try:
+    with AsyncReportWriter():                  # would silently drop the output
+        pass
+except TypeError as error:
+    print("TypeError:", error)
+
+
+# ============================================================================
+# Benchmark: lines/sec, print() per line vs. ReportWriter
+# ============================================================================
+
+def benchmark(orders=50_000):
+    print(f"\n=== Benchmark: {orders:,} pizza reports to {os.devnull} ===")
+    toppings = ("pepperoni", "mushrooms", "olives")
+    options = {"size": "large", "crust": "thin", "extra_cheese": True}
+    sample = io.StringIO()
+    with ReportWriter(sample) as report:
+        make_pizza(*toppings, report=report, **options)
+    lines_per_report = sample.getvalue().count("\n")
+
+    def lines_per_sec(report):
+        start = time.perf_counter()
+        for _ in range(orders):
+            make_pizza(*toppings, report=report, **options)
+        if isinstance(report, ReportWriter):
+            report.flush()                     # the last block is part of the cost
+        return orders * lines_per_report / (time.perf_counter() - start)
+
+    with open(os.devnull, "w") as devnull:
+        # A plain file is already block-buffered by Python: print() per line
+        # only pays its per-call overhead, so the gap here is small
+        print(f"plain print() per line:         {lines_per_sec(LineWriter(devnull)):>12,.0f} lines/sec")
+        # A terminal (or a log flushed per line) writes every line: that is
+        # where one big block per flush pays off
+        print(f"print() + flush per line (tty): {lines_per_sec(LineWriter(devnull, flush=True)):>12,.0f} lines/sec")
+        print(f"ReportWriter:                   {lines_per_sec(ReportWriter(devnull)):>12,.0f} lines/sec")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Building text in memory (io.StringIO) is cheap; each write to a terminal
+  or a line-flushed log is comparatively expensive
+- Files opened with open() are already block-buffered, so against them the
+  gain is small - measure before assuming a speedup
+- Keep the print()-style API so porting a function is a one-word change
+- Flush when the buffer is big, and always at the end (`with` block)
+- Async version: buffer synchronously, write the block in a thread with
+  asyncio.to_thread so the event loop is never blocked; a full buffer
+  starts a flush task, and a lock keeps the blocks in order
+- Trade-off: buffered output shows up later, not line by line
+"""
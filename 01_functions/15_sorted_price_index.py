@@ -0,0 +1,146 @@
+"""
+SORTED PRICE INDEX - stop re-sorting the menu on every question
+
+10_lambda.py sorts the menu like this:
+
+    sorted_by_price = sorted(chai_menu, key=lambda item: item['price'])
+
+That's perfect for one-off use. But if the menu service is asked
+"what are the 3 cheapest chais?" or "what costs between 60 and 75?"
+thousands of times a second, re-sorting the whole menu every time is
+O(n log n) work per question.
+
+Three tools from the standard library do better:
+- bisect:  keep a list ALWAYS sorted; find positions by binary search
+- heapq:   pick the K smallest/largest without sorting everything
+- a dict:  name -> price, so updates can find the old entry directly
+"""
+
+import bisect
+import heapq
+import random
+import time
+
+# ============================================================================
+# The index: a sorted list of (price, name) + a name -> price dict
+# ============================================================================
+
+class PriceIndex:
+    def __init__(self, menu=()):
+        self._price_of = {item['name']: item['price'] for item in menu}
+        # Tuples sort by price first, then name (so equal prices stay ordered)
+        self._sorted = sorted((price, name) for name, price in self._price_of.items())
+
+    def set_price(self, name, price):
+        """Insert a new chai or update an existing one's price"""
+        old = self._price_of.get(name)
+        if old is not None:
+            # Binary search finds the old entry (O(log n)) instead of scanning
+            del self._sorted[bisect.bisect_left(self._sorted, (old, name))]
+        self._price_of[name] = price
+        bisect.insort(self._sorted, (price, name))
+
+    def remove(self, name):
+        price = self._price_of.pop(name)
+        del self._sorted[bisect.bisect_left(self._sorted, (price, name))]
+
+    def cheapest(self, k):
+        return [{'name': name, 'price': price} for price, name in self._sorted[:max(k, 0)]]
+
+    def priciest(self, k):
+        # Not self._sorted[-k:]: with k=0 that would be the WHOLE list
+        start = len(self._sorted) - max(k, 0)
+        return [{'name': name, 'price': price} for price, name in reversed(self._sorted[max(start, 0):])]
+
+    def price_band(self, low, high):
+        """Everything with low <= price <= high"""
+        start = bisect.bisect_left(self._sorted, (low,))
+        # (high, chr(0x10FFFF)) sorts after every real (high, name) pair
+        stop = bisect.bisect_right(self._sorted, (high, chr(0x10FFFF)))
+        return [{'name': name, 'price': price} for price, name in self._sorted[start:stop]]
+
+    def __len__(self):
+        return len(self._sorted)
+
+
+def top_k_cheapest(menu, k):
+    """No index at all? heapq still beats a full sort when k is small"""
+    return heapq.nsmallest(k, menu, key=lambda item: item['price'])
+
+
+chai_menu = [
+    {'name': 'Masala', 'price': 80},
+    {'name': 'Ginger', 'price': 60},
+    {'name': 'Kadak', 'price': 70}
+]
+
+index = PriceIndex(chai_menu)
+print("Sorted by price:", index.cheapest(len(index)))   # same as sorted_by_price
+print("Cheapest 2:", index.cheapest(2))
+print("Between 65 and 80:", index.price_band(65, 80))
+
+index.set_price('Tulsi', 55)                             # insert
+index.set_price('Masala', 50)                            # update
+print("After changes:", index.cheapest(len(index)))
+print("heapq top-2:", top_k_cheapest(chai_menu, 2))
+
+
+# ============================================================================
+# Benchmark: "cheapest 10" and "price band" questions vs. full re-sort
+# ============================================================================
+
+def benchmark(n_items=100_000, questions=50):
+    rng = random.Random(5)
+    big_menu = [{'name': f'Chai {i}', 'price': rng.randint(20, 500)} for i in range(n_items)]
+    big_index = PriceIndex(big_menu)
+
+    start = time.perf_counter()
+    for _ in range(questions):
+        resorted = sorted(big_menu, key=lambda item: item['price'])[:10]
+    sort_time = (time.perf_counter() - start) / questions
+
+    start = time.perf_counter()
+    for _ in range(questions):
+        heap_top = top_k_cheapest(big_menu, 10)
+    heap_time = (time.perf_counter() - start) / questions
+
+    start = time.perf_counter()
+    for _ in range(questions):
+        indexed = big_index.cheapest(10)
+    index_time = (time.perf_counter() - start) / questions
+    # Check before the price updates below can change any of these items
+    expected = [item['price'] for item in resorted]
+    assert [item['price'] for item in heap_top] == expected
+    assert [item['price'] for item in indexed] == expected
+
+    start = time.perf_counter()
+    for _ in range(questions):
+        big_index.set_price(f'Chai {rng.randrange(n_items)}', rng.randint(20, 500))
+    update_time = (time.perf_counter() - start) / questions
+
+    start = time.perf_counter()
+    for _ in range(questions):
+        band = big_index.price_band(100, 101)
+    band_time = (time.perf_counter() - start) / questions
+
+    print(f"\n=== Benchmark: {n_items:,}-item menu ===")
+    print(f"Cheapest 10, full sort:     {sort_time * 1e6:10.1f} µs")
+    print(f"Cheapest 10, heapq:         {heap_time * 1e6:10.1f} µs")
+    print(f"Cheapest 10, PriceIndex:    {index_time * 1e6:10.1f} µs")
+    print(f"Price band (100-101):       {band_time * 1e6:10.1f} µs ({len(band)} items)")
+    print(f"Price update (bisect):      {update_time * 1e6:10.1f} µs")
+    del indexed
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- sorted() every time = O(n log n) per question
+- heapq.nsmallest(k, ...) = O(n log k): good when there's no index
+- A list kept sorted with bisect answers "first k" and "between a and b"
+  with a binary search + a slice
+- Store (price, name) tuples so ties are broken by name and lookups are exact
+- Updates: binary-search to find the old entry, insort the new one
+  (the search is O(log n); shifting list items is a fast memmove)
+"""
@@ -0,0 +1,139 @@
+"""
+COMPACT MENU STORAGE: __slots__ records and columns
+
+10_lambda.py stores the menu as a list of dicts:
+
+    chai_menu = [
+        {'name': 'Masala', 'price': 80},
+        ...
+    ]
+
+Each dict carries its own hash table (~180+ bytes) just to hold two
+fields whose names are the same for every item. With millions of items
+that overhead is most of the memory.
+
+Two lighter shapes:
+1. MenuItem with __slots__: fixed fields, no per-object __dict__
+2. MenuColumns: one list of names + one array('d') of prices
+   ("column-oriented": all prices sit next to each other as raw doubles)
+
+Both still work with filter() / map() / sorted() and item['price'].
+"""
+
+import sys
+import time
+import tracemalloc
+from array import array
+
+# ============================================================================
+# 1. A record type with __slots__
+# ============================================================================
+
+class MenuItem:
+    __slots__ = ("name", "price")
+
+    def __init__(self, name, price):
+        self.name = name
+        self.price = price
+
+    def __getitem__(self, field):
+        # item['price'] keeps working, so old lambdas don't need changes
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __repr__(self):
+        return f"MenuItem(name={self.name!r}, price={self.price})"
+
+
+# ============================================================================
+# 2. A column-oriented container
+# ============================================================================
+
+class MenuColumns:
+    def __init__(self, items=()):
+        self.names = []               # interned: equal names share one string
+        self.prices = array("d")      # 8 bytes per price, no int/float objects
+        for item in items:
+            self.append(item['name'], item['price'])
+
+    def append(self, name, price):
+        self.names.append(sys.intern(name))
+        self.prices.append(price)
+
+    def __len__(self):
+        return len(self.prices)
+
+    def __getitem__(self, i):
+        return MenuItem(self.names[i], self.prices[i])
+
+    def __iter__(self):
+        # Records are created on the fly and can be thrown away right after
+        return map(MenuItem, self.names, self.prices)
+
+
+chai_menu = [
+    {'name': 'Masala', 'price': 80},
+    {'name': 'Ginger', 'price': 60},
+    {'name': 'Kadak', 'price': 70}
+]
+
+menu = MenuColumns(chai_menu)
+print("Sorted by price:", sorted(menu, key=lambda item: item['price']))
+print("Under 75:", [item.name for item in filter(lambda item: item.price < 75, menu)])
+print("With tax:", list(map(lambda price: round(price * 1.1, 2), menu.prices)))  # column only
+print("Cheapest price:", min(menu.prices))
+
+
+# ============================================================================
+# Benchmark: memory (tracemalloc) for each layout
+# ============================================================================
+
+def measure(build):
+    tracemalloc.start()
+    data = build()
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return data, current
+
+
+def benchmark(n_items=300_000):
+    names = [f"Chai {i % 500}" for i in range(n_items)]   # repeated names, like a real catalog
+    prices = [float(20 + i % 400) for i in range(n_items)]
+
+    print(f"\n=== Benchmark: {n_items:,} menu items ===")
+    results = {}
+    for label, build in (
+        ("list of dicts", lambda: [{'name': n, 'price': p} for n, p in zip(names, prices)]),
+        ("list of MenuItem", lambda: [MenuItem(n, p) for n, p in zip(names, prices)]),
+        ("MenuColumns", lambda: MenuColumns({'name': n, 'price': p} for n, p in zip(names, prices))),
+    ):
+        data, size = measure(build)
+        results[label] = data
+
+        start = time.perf_counter()
+        cheap = sum(1 for item in data if item['price'] < 100)
+        scan_time = time.perf_counter() - start
+        print(f"{label:>17}: {size / n_items:6.1f} bytes/item, "
+              f"{size / 1e6:6.1f} MB, scan {scan_time * 1000:6.1f} ms ({cheap:,} under 100)")
+
+    columns = results["MenuColumns"]
+    start = time.perf_counter()
+    cheap = sum(1 for price in columns.prices if price < 100)
+    print(f"{'prices column':>17}: scan {(time.perf_counter() - start) * 1000:6.1f} ms "
+          f"({cheap:,} under 100) - no records created at all")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- A dict per record repeats the field names' hash table for every item
+- __slots__ fixes the fields up front: no __dict__, much smaller objects
+- Columns (array('d') for numbers) store raw values, 8 bytes each
+- sys.intern() makes repeated names share a single string object
+- Keep item['price'] working with __getitem__ so existing lambdas still run
+- For numeric work, scan the column directly instead of building records
+- Trade-off: iterating MenuColumns as records is slower, because every
+  MenuItem is built on the fly - memory is saved, not time
+"""
@@ -0,0 +1,170 @@
+"""
+SUMMING HUGE INPUTS: iterables, chunks and a process pool
+
+06_args_kwargs_explained.py has:
+
+    def calculate_sum(*numbers):
+        total = 0
+        for num in numbers:
+            total += num
+        return total
+
+Two costs when the input is big (say 10 million values):
+1. calculate_sum(*values) first copies EVERYTHING into a new tuple
+2. the for-loop runs in Python, one += at a time
+
+sum_values() below:
+- takes the iterable/buffer itself (list, range, array, memoryview, generator)
+- uses the C-level sum() for ints (exact - Python ints never overflow)
+- uses math.fsum() for floats (exact rounding, no drift from += on floats)
+- optionally splits the input into chunks and sums them in a process pool
+"""
+
+import ctypes
+import math
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+# ============================================================================
+# Summing one chunk (runs in the main process or in a worker)
+# ============================================================================
+
+def _sum_chunk(chunk):
+    if isinstance(chunk, (array, memoryview)):
+        code = chunk.typecode if isinstance(chunk, array) else chunk.format
+        return math.fsum(chunk) if code in "fd" else sum(chunk)
+    # Mixed/unknown content: ints stay exact, any float switches to fsum
+    if any(isinstance(value, float) for value in chunk):
+        return math.fsum(chunk)
+    return sum(chunk)
+
+
+def _native_code(fmt, itemsize):
+    """Buffer format ("q", "<q", "=i", ...) -> array typecode of the same size"""
+    code = fmt.lstrip("@=<>!")
+    if code in ("f", "d"):
+        native = code
+    elif len(code) == 1 and code.lower() in "bhilq":
+        native = {1: "b", 2: "h", 4: "i", 8: "q"}.get(itemsize, "?")
+        native = native.upper() if code.isupper() else native
+    else:
+        native = "?"
+    if native == "?" or array(native).itemsize != itemsize:
+        raise ValueError(f"Unsupported buffer format {fmt!r}")
+    return native
+
+
+def _buffer_chunks(buffer, size, copy):
+    """
+    Slices of a memoryview are views too: nothing is copied unless the chunk
+    has to be pickled for a worker (copy=True) or its byte order is foreign.
+    Then only ONE chunk at a time is copied into an array.
+    """
+    code = _native_code(buffer.format, buffer.itemsize)
+    order = buffer.format[:1]
+    swap = order in "<>!" and (order == "<") != (sys.byteorder == "little")
+    flat = buffer.cast("B").cast(code)             # 1-D, native format, still no copy
+    for start in range(0, len(flat), size):
+        view = flat[start:start + size]
+        if copy or swap:
+            chunk = array(code)
+            chunk.frombytes(view.cast("B"))
+            if swap:
+                chunk.byteswap()
+            yield chunk
+        else:
+            yield view
+
+
+def _chunks(values, size, copy_buffers=False):
+    """Slice sequences/buffers (cheap); pull lists out of anything else"""
+    if isinstance(values, memoryview):
+        yield from _buffer_chunks(values, size, copy_buffers)
+    elif isinstance(values, (list, tuple, range, array)):   # deque, dict, ... can't slice
+        for start in range(0, len(values), size):
+            yield values[start:start + size]
+    else:
+        it = iter(values)
+        while chunk := list(islice(it, size)):
+            yield chunk
+
+
+def sum_values(values, workers=1, chunk_size=1_000_000):
+    """
+    values:  any iterable or buffer of numbers
+    workers: 1 = sum here; >1 = chunks are summed in a process pool, with at
+             most workers * 2 chunks read (and pickled) ahead at any time;
+             None = one per CPU core
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        partials = [_sum_chunk(chunk) for chunk in _chunks(values, chunk_size)]
+    else:
+        partials = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight = deque()
+            for chunk in _chunks(values, chunk_size, copy_buffers=True):
+                in_flight.append(pool.submit(_sum_chunk, chunk))
+                if len(in_flight) >= workers * 2:
+                    partials.append(in_flight.popleft().result())
+            partials.extend(future.result() for future in in_flight)
+    if any(isinstance(p, float) for p in partials):
+        return math.fsum(partials)
+    return sum(partials)
+
+
+def calculate_sum(*numbers):
+    """The original, kept for small ad-hoc calls"""
+    total = 0
+    for num in numbers:
+        total += num
+    return total
+
+
+# Process pools re-import this file in each worker, so guard the demo
+if __name__ == "__main__":
+    print("Sum of 1, 2, 3:", sum_values([1, 2, 3]))                 # 6
+    print("Sum of a range:", sum_values(range(1, 101)))              # 5050
+    print("Big ints stay exact:", sum_values([10**30, 1, -10**30]))  # 1
+    print("Floats, fsum:", sum_values([0.1] * 10))                   # 1.0 (+= gives 0.9999999999999999)
+    print("Generator:", sum_values(cups for cups in (5, 10, 12) if cups > 5))  # 22
+    print("memoryview:", sum_values(memoryview(array("q", [5, 10, 12]))))  # 27, sliced without copying
+    print("deque / dict keys:", sum_values(deque([1, 2, 3])), sum_values({1: "a", 2: "b"}))  # 6 3
+    print("'<q' buffer:", sum_values(memoryview((ctypes.c_int64 * 3)(5, 10, 12))))  # 27
+
+    # ========================================================================
+    # Benchmark: 10^7 values
+    # ========================================================================
+    n = 10_000_000
+    values = array("q", range(n))
+    expected = n * (n - 1) // 2
+    print(f"\n=== Benchmark: summing {n:,} ints ({os.cpu_count()} cores) ===")
+
+    start = time.perf_counter()
+    assert calculate_sum(*values) == expected
+    print(f"{'calculate_sum(*values):':<24} {time.perf_counter() - start:.3f}s")
+
+    for workers in (1, 2, 4):
+        start = time.perf_counter()
+        assert sum_values(values, workers=workers) == expected
+        print(f"{f'sum_values(workers={workers}):':<24} {time.perf_counter() - start:.3f}s")
+
+
+"""
+KEY POINTS:
+- f(*values) copies the whole input into a tuple before the call even starts
+- Accept the iterable itself; slicing arrays/lists into chunks is cheap,
+  and slicing a memoryview copies nothing at all
+- Feed a pool through a small window of futures, not pool.map() over a
+  generator (map reads the whole input up front)
+- Built-in sum() runs in C and is exact for ints
+- math.fsum() avoids float rounding drift (0.1 added ten times == 1.0)
+- Process pools pay to pickle every chunk, so they only win when there are
+  several cores AND the per-chunk work is bigger than the copying
+- Guard process-pool code with if __name__ == "__main__":
+"""
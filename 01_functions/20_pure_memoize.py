@@ -0,0 +1,207 @@
+"""
+MEMOIZING PURE FUNCTIONS
+
+08_types_of_functions.py explains:
+
+    PURE:   same input -> same output, no side effects   (add, add_pure)
+    IMPURE: depends on / changes outside state           (increment, get_total)
+
+Because a pure function ALWAYS gives the same answer for the same input,
+we can remember (memoize) answers and skip the work next time. That is
+only safe for pure functions - caching increment() would be a bug.
+
+@pure below:
+- caches results in a bounded LRU (least recently used answers are dropped)
+- can expire answers after `ttl` seconds
+- counts hits / misses / evictions
+- REFUSES functions marked @impure
+- accepts a `version` callable for functions like get_total that read
+  outside state: the version becomes part of the cache key, so changing
+  the state (and bumping its version) can never return a stale answer
+"""
+
+import time
+from collections import OrderedDict
+from functools import wraps
+
+# ============================================================================
+# The decorators
+# ============================================================================
+
+def impure(func):
+    """Mark a function as impure so @pure will refuse to cache it"""
+    func.__impure__ = True
+    return func
+
+
+def pure(func=None, *, maxsize=128, ttl=None, version=None):
+    """
+    @pure                              - LRU cache of 128 answers
+    @pure(maxsize=1000, ttl=60)        - answers expire after 60 seconds
+    @pure(version=lambda: stock.version)
+    """
+    if func is None:                   # used as @pure(...) with options
+        return lambda f: pure(f, maxsize=maxsize, ttl=ttl, version=version)
+
+    if getattr(func, "__impure__", False):
+        raise TypeError(f"{func.__name__} is marked @impure and cannot be memoized")
+
+    cache = OrderedDict()              # key -> (result, time stored)
+    stats = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0}
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        if version is not None:
+            key = (version(), key)
+
+        entry = cache.get(key)
+        if entry is not None:
+            result, stored_at = entry
+            if ttl is None or time.monotonic() - stored_at < ttl:
+                cache.move_to_end(key)         # mark as recently used
+                stats["hits"] += 1
+                return result
+            del cache[key]
+            stats["expired"] += 1
+
+        stats["misses"] += 1
+        result = func(*args, **kwargs)
+        cache[key] = (result, time.monotonic())
+        if len(cache) > maxsize:
+            cache.popitem(last=False)          # drop the least recently used
+            stats["evictions"] += 1
+        return result
+
+    wrapper.cache_stats = lambda: dict(stats, size=len(cache))
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+# ============================================================================
+# Pure functions from 08_types_of_functions.py
+# ============================================================================
+
+@pure
+def add(a, b):
+    return a + b
+
+
+@pure(maxsize=2)
+def add_pure(current_total, value):
+    return current_total + value
+
+
+print("add(2, 3):", add(2, 3), add(2, 3))           # 5 5 - second one from cache
+print("add stats:", add.cache_stats())               # 1 hit, 1 miss
+
+for value in (10, 20, 30, 10):
+    add_pure(0, value)
+print("add_pure stats:", add_pure.cache_stats())    # maxsize=2 -> evictions
+
+
+@pure(ttl=0.05)
+def daily_special(day):
+    return f"{day}: Masala Chai"
+
+daily_special("Monday")
+time.sleep(0.06)                                     # wait longer than the ttl
+daily_special("Monday")
+print("daily_special stats:", daily_special.cache_stats())  # 1 expired
+
+
+# ============================================================================
+# Impure functions are refused
+# ============================================================================
+
+counter = 0
+
+@impure
+def increment():
+    global counter
+    counter += 1
+    return counter
+
+try:
+    pure(increment)
+except TypeError as error:
+    print("\nTypeError:", error)
+
+
+# ============================================================================
+# get_total: depends on chai_stock, so cache it by the stock's VERSION
+# ============================================================================
+
+class ChaiStock:
+    """chai_stock plus a version that goes up on every change"""
+
+    def __init__(self, cups):
+        self.version = 0
+        self._cups = cups
+
+    @property
+    def cups(self):
+        return self._cups
+
+    @cups.setter
+    def cups(self, value):
+        self._cups = value
+        self.version += 1
+
+
+chai_stock = ChaiStock(10)
+
+@pure(version=lambda: chai_stock.version)
+def get_total(price):
+    return chai_stock.cups * price
+
+print("\nget_total(50):", get_total(50))            # 500
+print("get_total(50):", get_total(50))              # 500 (cache hit)
+chai_stock.cups = 20                                 # version 0 -> 1
+print("get_total(50):", get_total(50))              # 1000 - not stale!
+print("get_total stats:", get_total.cache_stats())
+
+
+# ============================================================================
+# Benchmark: repeated pricing calls
+# ============================================================================
+
+def price_with_tax_uncached(base, quantity):
+    # Stand-in for a pricing rule that takes real work
+    total = 0.0
+    for step in range(200):
+        total += base * quantity * (1 + (step % 5) / 100)
+    return round(total / 200, 2)
+
+price_with_tax = pure(maxsize=1024)(price_with_tax_uncached)
+
+
+def benchmark(calls=20_000):
+    orders = [(50 + i % 7 * 10, 1 + i % 5) for i in range(calls)]   # only 35 distinct orders
+
+    start = time.perf_counter()
+    for base, quantity in orders:
+        price_with_tax_uncached(base, quantity)
+    plain = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for base, quantity in orders:
+        price_with_tax(base, quantity)
+    cached = time.perf_counter() - start
+
+    print(f"\n=== Benchmark: {calls:,} pricing calls ===")
+    print(f"No cache: {plain:.3f}s")
+    print(f"@pure:    {cached:.3f}s ({plain / cached:.0f}x faster) {price_with_tax.cache_stats()}")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Only PURE functions are safe to memoize
+- LRU (OrderedDict + move_to_end/popitem) keeps memory bounded
+- TTL expires answers that may go out of date with time
+- For functions that read outside state, put a VERSION of that state in
+  the cache key: change the state -> bump the version -> fresh answer
+- functools.lru_cache does the plain LRU part for you in real code
+"""
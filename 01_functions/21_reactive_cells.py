@@ -0,0 +1,172 @@
+"""
+VERSIONED STATE CELLS - caching functions that read globals
+
+08_types_of_functions.py shows the problem with get_total:
+
+    chai_stock = 10
+    def get_total(price):
+        return chai_stock * price
+
+    get_total(50)   # 500
+    chai_stock = 20
+    get_total(50)   # 1000 - same input, different answer!
+
+20_pure_memoize.py fixed this for ONE piece of state by putting its
+version into the cache key. Here we generalize:
+
+- every piece of shared state lives in a Cell that counts its changes
+- a State object groups the cells, so `state.chai_stock = 20` still reads
+  like assigning a global
+- @depends_on(...) names the cells a function reads; a cached answer is
+  reused only while ALL of those cells are at the same version
+
+Changing a cell the function does NOT read leaves its cache alone, and
+nothing is recomputed until someone actually asks.
+"""
+
+import time
+from functools import wraps
+
+# ============================================================================
+# Cells and the State container
+# ============================================================================
+
+class Cell:
+    __slots__ = ("name", "_value", "version")
+
+    def __init__(self, name, value):
+        self.name = name
+        self._value = value
+        self.version = 0
+
+    @property
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, new_value):
+        if new_value != self._value:   # writing the same value is not a change
+            self._value = new_value
+            self.version += 1
+
+    def __repr__(self):
+        return f"Cell({self.name}={self._value!r}, v{self.version})"
+
+
+class State:
+    """state.chai_stock reads/writes the value; state.cell("chai_stock") gives the Cell"""
+
+    def __init__(self, **values):
+        object.__setattr__(self, "_cells", {name: Cell(name, v) for name, v in values.items()})
+
+    def cell(self, name):
+        return self._cells[name]
+
+    def __getattr__(self, name):
+        try:
+            return self._cells[name].value
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        if name in self._cells:
+            self._cells[name].value = value
+        else:
+            self._cells[name] = Cell(name, value)
+
+
+# ============================================================================
+# @depends_on: cache keyed by arguments, validated by dependency versions
+# ============================================================================
+
+def depends_on(*cells):
+    def decorator(func):
+        cache = {}                     # args -> (versions when computed, result)
+        stats = {"hits": 0, "recomputed": 0}
+
+        @wraps(func)
+        def wrapper(*args):
+            versions = tuple(cell.version for cell in cells)
+            entry = cache.get(args)
+            if entry is not None and entry[0] == versions:
+                stats["hits"] += 1
+                return entry[1]
+            stats["recomputed"] += 1
+            result = func(*args)
+            cache[args] = (versions, result)   # overwrite the stale entry
+            return result
+
+        wrapper.dependencies = tuple(cell.name for cell in cells)
+        wrapper.cache_stats = lambda: dict(stats, size=len(cache))
+        return wrapper
+    return decorator
+
+
+state = State(chai_stock=10, milk_litres=5, tax_rate=0.05)
+
+@depends_on(state.cell("chai_stock"))
+def get_total(price):
+    return state.chai_stock * price
+
+@depends_on(state.cell("chai_stock"), state.cell("tax_rate"))
+def get_total_with_tax(price):
+    return round(state.chai_stock * price * (1 + state.tax_rate), 2)
+
+
+print("get_total(50):", get_total(50))                    # 500 (computed)
+print("get_total(50):", get_total(50))                    # 500 (cached)
+state.chai_stock = 20                                      # chai_stock v0 -> v1
+print("get_total(50):", get_total(50))                    # 1000 - recomputed, not stale
+state.milk_litres = 8                                      # unrelated cell
+print("get_total(50):", get_total(50))                    # 1000 - still cached
+print("get_total stats:", get_total.cache_stats())        # 2 hits, 2 recomputed
+
+print("\nwith tax:", get_total_with_tax(50))              # 1050.0
+state.tax_rate = 0.12
+print("with tax after tax change:", get_total_with_tax(50))  # 1120.0
+state.tax_rate = 0.12                                      # same value -> no new version
+print("with tax again:", get_total_with_tax(50), get_total_with_tax.cache_stats())
+print("Cells:", state.cell("chai_stock"), state.cell("tax_rate"))
+
+
+# ============================================================================
+# Benchmark: recompute-always vs. recompute-only-when-a-dependency-changed
+# ============================================================================
+
+def slow_total(price):
+    # Stand-in for an expensive calculation that reads chai_stock
+    total = 0
+    for _ in range(50):
+        total += state.chai_stock * price
+    return total // 50
+
+cached_total = depends_on(state.cell("chai_stock"))(slow_total)
+
+
+def benchmark(requests=20_000, stock_change_every=1_000):
+    print(f"\n=== Benchmark: {requests:,} requests, stock changes every {stock_change_every:,} ===")
+    prices = [50, 60, 70, 80]
+    for label, func in (("always recompute", slow_total), ("@depends_on", cached_total)):
+        start = time.perf_counter()
+        for i in range(requests):
+            if i % stock_change_every == 0:
+                state.chai_stock = 100 + i // stock_change_every
+            # Unrelated state changes on every request - must NOT invalidate
+            state.milk_litres = i
+            func(prices[i % 4])
+        print(f"{label:>16}: {time.perf_counter() - start:.3f}s")
+    print(f"@depends_on stats: {cached_total.cache_stats()}")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- A global that changes makes a function IMPURE; caching it naively gives
+  stale answers
+- Wrap shared state in cells that count their changes (a version number)
+- Store the versions next to each cached answer; reuse it only if every
+  dependency still has the same version
+- Changes to state a function does not read don't throw its cache away
+- Writing the same value again is not a change, so it costs nothing
+"""
@@ -17,4 +17,41 @@
 # from .recipies.flavours import elachi_chai, ginger_chai
 
 # print(elachi_chai())
-# print(ginger_chai())
\ No newline at end of file
+# print(ginger_chai())
+
+
+# 4th way:---> lazy package attribute (see recipies/__init__.py)
+# import recipies    # fast: flavours.py is NOT imported yet
+
+# print(recipies.elachi_chai())   # flavours.py is imported now, on first use
+# print(recipies.ginger_chai())   # already loaded, normal attribute lookup
+
+
+
+# 5th way:---> importlib.util.LazyLoader (lazy import of any module)
+# import importlib.util
+# import sys
+
+# def lazy_import(name):
+#     spec = importlib.util.find_spec(name)
+#     spec.loader = importlib.util.LazyLoader(spec.loader)
+#     module = importlib.util.module_from_spec(spec)
+#     sys.modules[name] = module
+#     spec.loader.exec_module(module)   # doesn't run the module's code yet
+#     return module
+
+# flavours = lazy_import("recipies.flavours")
+# print(flavours.elachi_chai())   # the module's code runs on this first attribute access
+
+
+
+# Measure import cost: python startup_benchmark.py
+
+
+
+# 6th way:---> look recipes up BY NAME through the registry (see recipies/registry.py)
+# from recipies.registry import RecipeRegistry
+
+# registry = RecipeRegistry.load()          # reads the saved manifest, no scanning
+# print(registry.dispatch("elachi_chai"))
+# print(registry.dispatch("ginger_chai"))
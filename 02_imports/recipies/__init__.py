@@ -0,0 +1,41 @@
+# Lazy package: recipe modules are imported the first time they are used,
+# not when `import recipies` runs.
+#
+#   import recipies
+#   recipies.elachi_chai()    # <- flavours.py is imported HERE, on first access
+#   recipies.flavours         # submodules load lazily too
+#
+# Module-level __getattr__ (PEP 562) is only called for names that are NOT
+# already in the module, so after the first access the name is cached in
+# globals() and later lookups are normal, fast attribute reads.
+
+import importlib
+import os
+
+# public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "elachi_chai": "flavours",
+    "ginger_chai": "flavours",
+}
+
+
+def _submodules():
+    # A plain directory listing: cheaper to import than pkgutil
+    return {file[:-3] for folder in __path__ for file in os.listdir(folder)
+            if file.endswith(".py") and file != "__init__.py"}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(f".{_LAZY_ATTRS[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _submodules():
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value           # cache: __getattr__ won't run again for it
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _submodules())
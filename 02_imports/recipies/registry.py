@@ -0,0 +1,135 @@
+# Recipe registry: find every recipe function in the recipies package ONCE,
+# remember where it lives in a small JSON manifest, and dispatch by name.
+#
+#   from recipies.registry import RecipeRegistry
+#   registry = RecipeRegistry.load()
+#   registry.dispatch("ginger_chai")        # -> "Ginger chai is ready"
+#
+# - Discovery reads each module's source with `ast` (no importing needed)
+#   and records every public top-level function as "module:function".
+# - The manifest is rewritten only when a recipe file is newer than it,
+#   so later startups skip the scan entirely. It is written to a temp file
+#   and renamed into place, so a startup running at the same time never reads
+#   half of it; if the folder is read-only the fresh scan is used from memory.
+# - Lookups go through a plain dict (O(1)); a recipe's module is imported
+#   the first time that recipe is dispatched, then the function is cached.
+#
+# Try it from the 02_imports folder:  python -m recipies.registry
+
+import ast
+import importlib
+import json
+import os
+import tempfile
+import time
+
+PACKAGE = __package__          # "recipies", also when run with -m
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST = os.path.join(PACKAGE_DIR, ".recipe_manifest.json")
+SKIP = {"__init__.py", "registry.py"}
+
+
+def _recipe_files():
+    return sorted(f for f in os.listdir(PACKAGE_DIR) if f.endswith(".py") and f not in SKIP)
+
+
+def scan():
+    """Build {recipe name: "module:function"} by parsing every recipe file"""
+    manifest = {}
+    for filename in _recipe_files():
+        module = filename[:-3]
+        with open(os.path.join(PACKAGE_DIR, filename)) as f:
+            tree = ast.parse(f.read(), filename)
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
+                if node.name in manifest:
+                    raise ValueError(f"Recipe {node.name!r} is defined in both "
+                                     f"{manifest[node.name]} and {module}")
+                manifest[node.name] = f"{module}:{node.name}"
+    return manifest
+
+
+def _save(manifest):
+    """Write to a temp file, then rename: readers see the old file or the new one"""
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=".recipe_manifest.", suffix=".tmp", dir=PACKAGE_DIR)
+    except OSError:
+        return                              # read-only install: keep it in memory only
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp, MANIFEST)
+        os.utime(MANIFEST)                  # the rename touched the folder; stay newer than it
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def _manifest_is_fresh():
+    if not os.path.exists(MANIFEST):
+        return False
+    built = os.path.getmtime(MANIFEST)
+    return all(os.path.getmtime(os.path.join(PACKAGE_DIR, f)) <= built for f in _recipe_files()) \
+        and os.path.getmtime(PACKAGE_DIR) <= built      # catches added/removed files
+
+
+class RecipeRegistry:
+    def __init__(self, manifest):
+        self._targets = dict(manifest)      # name -> "module:function"
+        self._resolved = {}                 # name -> function, filled on first use
+
+    @classmethod
+    def load(cls, rescan=False):
+        """Use the saved manifest if it's up to date, otherwise scan and save"""
+        if not rescan and _manifest_is_fresh():
+            try:
+                with open(MANIFEST) as f:
+                    return cls(json.load(f))
+            except (OSError, ValueError):   # unreadable or damaged: just rescan
+                pass
+        manifest = scan()
+        _save(manifest)
+        return cls(manifest)
+
+    def __getitem__(self, name):
+        func = self._resolved.get(name)
+        if func is None:
+            try:
+                module_name, func_name = self._targets[name].split(":")
+            except KeyError:
+                raise KeyError(f"No recipe named {name!r}") from None
+            module = importlib.import_module(f".{module_name}", PACKAGE)
+            func = self._resolved[name] = getattr(module, func_name)
+        return func
+
+    def __contains__(self, name):
+        return name in self._targets
+
+    def names(self):
+        return sorted(self._targets)
+
+    def dispatch(self, name, *args, **kwargs):
+        return self[name](*args, **kwargs)
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    registry = RecipeRegistry.load(rescan=True)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    registry = RecipeRegistry.load()
+    manifest_time = time.perf_counter() - start
+
+    print("Recipes:", registry.names())
+    for order in ("elachi_chai", "ginger_chai"):
+        print(f"{order}: {registry.dispatch(order)}")
+
+    start = time.perf_counter()
+    for _ in range(100_000):
+        registry["ginger_chai"]
+    lookup_time = (time.perf_counter() - start) / 100_000
+
+    print(f"\nScan + write manifest: {scan_time * 1000:.2f} ms")
+    print(f"Load saved manifest:   {manifest_time * 1000:.2f} ms")
+    print(f"Dispatch lookup:       {lookup_time * 1e9:.0f} ns per order")
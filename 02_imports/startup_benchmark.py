@@ -0,0 +1,46 @@
+# Startup benchmark for eager vs. lazy imports, using Python's own
+# `-X importtime` report (microseconds spent importing each module).
+#
+# Run from this folder:  python startup_benchmark.py
+
+import os
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SCENARIOS = {
+    "eager: from recipies.flavours import ...": "from recipies.flavours import elachi_chai, ginger_chai",
+    "lazy: import recipies": "import recipies",
+    "lazy + first use": "import recipies; recipies.elachi_chai()",
+    "lazy: import utils": "import utils",
+}
+
+
+def import_time_us(code, runs=5):
+    """Best-of-N total 'cumulative' import time of our own packages, in µs"""
+    best = None
+    for _ in range(runs):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                cwd=HERE, capture_output=True, text=True, check=True)
+        total = 0
+        # Lines look like: "import time:   self [us] | cumulative | imported package"
+        # Nested imports are indented further and already counted in their
+        # parent's cumulative time, so only top-level (1-space) lines count.
+        for line in result.stderr.splitlines():
+            parts = line.split("|")
+            if len(parts) != 3:
+                continue
+            name = parts[2]
+            top_level = name.startswith(" ") and not name.startswith("  ")
+            if top_level and name.strip().split(".")[0] in ("recipies", "utils"):
+                total += int(parts[1])
+        best = total if best is None else min(best, total)
+    return best
+
+
+for label, code in SCENARIOS.items():
+    print(f"{label:<42} {import_time_us(code):>6} µs")
+
+# Key point: with a handful of recipe modules the difference is tiny; it grows
+# with every module (and every heavy dependency) the eager import pulls in.
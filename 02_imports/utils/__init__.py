@@ -0,0 +1,24 @@
+# Lazy package: `import utils` is instant; each helper module (discounts, ...)
+# is imported only when it is first accessed as utils.<module>.
+# Same idea as recipies/__init__.py - see the notes there.
+
+import importlib
+import os
+
+
+def _submodules():
+    # A plain directory listing: cheaper to import than pkgutil
+    return {file[:-3] for folder in __path__ for file in os.listdir(folder)
+            if file.endswith(".py") and file != "__init__.py"}
+
+
+def __getattr__(name):
+    if name not in _submodules():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{name}", __name__)
+    globals()[name] = module          # cache: __getattr__ won't run again for it
+    return module
+
+
+def __dir__():
+    return sorted(set(globals()) | _submodules())
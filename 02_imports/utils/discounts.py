@@ -0,0 +1,234 @@
+# Discount engine: describe promotions once, compile them into a decision
+# table, then price WHOLE batches of order lines at a time.
+#
+#   from utils.discounts import percentage, bogo, compile_rules
+#   table = compile_rules([percentage(10), bogo(2, 1, item="samosa")],
+#                         menu=["masala chai", "samosa"])
+#   discount, net = table.apply(items, prices, quantities)
+#
+# - Order lines come in as COLUMNS: item codes, unit prices, quantities.
+# - compile_rules() decides up front which rule each menu item gets, so
+#   pricing a line never has to search the rule list.
+# - With NumPy installed every rule kind is one masked array operation;
+#   without it, each item code points at a small pre-built function.
+#
+# Try it from the 02_imports folder:  python -m utils.discounts
+
+import time
+from array import array
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - the stdlib path below still works
+    np = None
+
+NONE, PERCENT, FLAT, BOGO, TIERED = range(5)
+
+# item=None means "every item that has no rule of its own"
+Rule = namedtuple("Rule", "kind item params")
+
+
+# ============================================================================
+# Rule definitions
+# ============================================================================
+
+def percentage(percent, item=None):
+    """percent off the line total"""
+    return Rule(PERCENT, item, (percent,))
+
+
+def flat(amount, item=None):
+    """amount off each unit (never below zero)"""
+    return Rule(FLAT, item, (amount,))
+
+
+def bogo(buy, free, item=None):
+    """buy `buy`, get `free` more at no cost: bogo(1, 1) is buy one get one"""
+    return Rule(BOGO, item, (buy, free))
+
+
+def tiered(tiers, item=None):
+    """tiers = {min_quantity: percent}; the biggest tier reached applies"""
+    return Rule(TIERED, item, tuple(sorted(tiers.items())))
+
+
+def _line_discount(rule, price, quantity):
+    """Discount for ONE line, checking the rule kind every time (the item-by-item way)"""
+    if rule.kind == PERCENT:
+        return price * quantity * rule.params[0] / 100
+    if rule.kind == FLAT:
+        return min(rule.params[0], price) * quantity
+    if rule.kind == BOGO:
+        buy, free = rule.params
+        return quantity // (buy + free) * free * price
+    if rule.kind == TIERED:
+        percent = 0
+        for min_quantity, tier_percent in rule.params:
+            if quantity >= min_quantity:
+                percent = tier_percent
+        return price * quantity * percent / 100
+    return 0.0
+
+
+# ============================================================================
+# Compiling rules into a decision table
+# ============================================================================
+
+class DiscountTable:
+    def __init__(self, menu, chosen):
+        self.menu = list(menu)
+        self.codes = {name: code for code, name in enumerate(self.menu)}
+        self.rules = chosen                       # code -> Rule or None
+
+        # Stdlib path: one ready-made function per item code
+        self._calculators = [self._calculator(rule) for rule in chosen]
+
+        # NumPy path: the table as columns indexed by item code
+        if np is not None:
+            self._kind = np.array([r.kind if r else NONE for r in chosen], dtype=np.int8)
+            self._p1 = np.array([r.params[0] if r and r.kind != TIERED else 0 for r in chosen],
+                                dtype=np.float64)
+            self._p2 = np.array([r.params[1] if r and r.kind == BOGO else 0 for r in chosen],
+                                dtype=np.int64)
+
+    @staticmethod
+    def _calculator(rule):
+        # Each rule kind gets its own tiny function: no if-chain per line
+        if rule is None:
+            return lambda price, quantity: 0.0
+        if rule.kind == PERCENT:
+            rate = rule.params[0] / 100
+            return lambda price, quantity: price * quantity * rate
+        if rule.kind == FLAT:
+            amount = rule.params[0]
+            return lambda price, quantity: (amount if amount < price else price) * quantity
+        if rule.kind == BOGO:
+            buy, free = rule.params
+            return lambda price, quantity: quantity // (buy + free) * free * price
+        # TIERED: percent for every quantity up to the top tier, looked up directly
+        top = rule.params[-1][0]
+        percents = [0] * (top + 1)
+        for min_quantity, tier_percent in rule.params:
+            percents[min_quantity:] = [tier_percent] * (top + 1 - min_quantity)
+        return lambda price, quantity: price * quantity * percents[min(quantity, top)] / 100
+
+    def encode(self, names):
+        """Menu item names -> item code column"""
+        return array("l", map(self.codes.__getitem__, names))
+
+    def apply(self, items, prices, quantities):
+        """
+        items, prices, quantities: same-length columns (item codes from
+        encode(), unit prices, quantities). Returns (discount, net) columns.
+        """
+        if np is not None:
+            return self._apply_numpy(np.asarray(items), np.asarray(prices, dtype=np.float64),
+                                     np.asarray(quantities))
+
+        calculators = self._calculators
+        discount = array("d", map(lambda i, p, q: calculators[i](p, q), items, prices, quantities))
+        net = array("d", map(lambda p, q, d: p * q - d, prices, quantities, discount))
+        return discount, net
+
+    def _apply_numpy(self, items, prices, quantities):
+        kind, p1, p2 = self._kind[items], self._p1[items], self._p2[items]
+        gross = prices * quantities
+        discount = np.zeros(len(items))
+
+        mask = kind == PERCENT
+        discount[mask] = gross[mask] * p1[mask] / 100
+        mask = kind == FLAT
+        discount[mask] = np.minimum(p1[mask], prices[mask]) * quantities[mask]
+        mask = kind == BOGO
+        groups = quantities[mask] // (p1[mask].astype(np.int64) + p2[mask])
+        discount[mask] = groups * p2[mask] * prices[mask]
+
+        # Tiered rules: one pass per (item, tier) - there are only a handful
+        for code, rule in enumerate(self.rules):
+            if rule is not None and rule.kind == TIERED:
+                line = items == code
+                percent = np.zeros(len(items))
+                for min_quantity, tier_percent in rule.params:
+                    percent[line & (quantities >= min_quantity)] = tier_percent
+                discount[line] = gross[line] * percent[line] / 100
+
+        return discount, gross - discount
+
+
+def compile_rules(rules, menu):
+    """
+    Decide once which rule each menu item gets: a rule naming the item wins
+    over a shop-wide rule (item=None). Two rules for the same item is an error.
+    """
+    shop_wide = None
+    per_item = {}
+    for rule in rules:
+        if rule.item is None:
+            if shop_wide is not None:
+                raise ValueError("Only one shop-wide rule is allowed")
+            shop_wide = rule
+        elif rule.item not in menu:
+            raise ValueError(f"Rule for unknown item {rule.item!r}")
+        elif rule.item in per_item:
+            raise ValueError(f"Item {rule.item!r} already has a rule")
+        else:
+            per_item[rule.item] = rule
+    return DiscountTable(menu, [per_item.get(name, shop_wide) for name in menu])
+
+
+def apply_item_by_item(rules, lines):
+    """The old way: for every (item, price, quantity) line, search the rules"""
+    results = []
+    for item, price, quantity in lines:
+        rule = None
+        for candidate in rules:
+            if candidate.item == item:
+                rule = candidate
+                break
+            if candidate.item is None and rule is None:
+                rule = candidate
+        discount = _line_discount(rule, price, quantity) if rule else 0.0
+        results.append((discount, price * quantity - discount))
+    return results
+
+
+if __name__ == "__main__":
+    MENU = ["masala chai", "ginger chai", "samosa", "bun maska", "cutting chai"]
+    RULES = [
+        percentage(10),                                  # everything else: 10% off
+        flat(5, item="ginger chai"),                     # ₹5 off each cup
+        bogo(2, 1, item="samosa"),                       # buy 2 get 1 free
+        tiered({5: 10, 10: 20}, item="cutting chai"),    # 10% from 5 cups, 20% from 10
+    ]
+    table = compile_rules(RULES, MENU)
+
+    names = ["masala chai", "ginger chai", "samosa", "cutting chai", "cutting chai"]
+    items = table.encode(names)
+    prices = array("d", [50, 30, 20, 15, 15])
+    quantities = array("q", [2, 3, 3, 4, 10])
+    discount, net = table.apply(items, prices, quantities)
+    for name, d, n in zip(names, discount, net):
+        print(f"{name:>13}: discount ₹{d:6.2f}  pay ₹{n:7.2f}")
+    # masala 10.00 / ginger 15.00 / samosa 20.00 / cutting x4 0.00 / cutting x10 30.00
+
+    # Benchmark: 10^6 order lines
+    n = 1_000_000
+    codes = array("l", (i * 7 % len(MENU) for i in range(n)))
+    prices = array("d", (10 + i % 50 for i in range(n)))
+    quantities = array("q", (1 + i % 12 for i in range(n)))
+    lines = list(zip((MENU[c] for c in codes), prices, quantities))
+
+    start = time.perf_counter()
+    slow = apply_item_by_item(RULES, lines)
+    item_by_item = time.perf_counter() - start
+
+    start = time.perf_counter()
+    table = compile_rules(RULES, MENU)
+    discount, net = table.apply(codes, prices, quantities)
+    batch = time.perf_counter() - start
+
+    assert all(abs(a[0] - b) < 1e-6 for a, b in zip(slow, discount))
+    print(f"\n=== Benchmark: {n:,} order lines ({'NumPy' if np else 'stdlib'}) ===")
+    print(f"Item by item:            {item_by_item:.3f}s")
+    print(f"Compiled table (batch):  {batch:.3f}s ({item_by_item / batch:.1f}x faster)")
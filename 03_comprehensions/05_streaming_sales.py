@@ -0,0 +1,164 @@
+"""
+STREAMING SALES PIPELINE - generators all the way down
+
+04_generator_compre.py showed:
+
+    total_cups = sum(sale for sale in daily_sales if sale > 5)
+
+...but daily_sales was still a list sitting in memory. Real sales logs are
+FILES, often bigger than RAM. So here every step is a generator:
+
+    read_sales(file)  ->  keep(sale > 5)  ->  transform(...)  ->  SalesStats
+    (chunk by chunk)      (filter stage)      (map stage)         (one pass)
+
+Only one chunk of the file is ever in memory, no matter how big it is.
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+# ============================================================================
+# Stage 1: read sales lazily, in fixed-size chunks
+# ============================================================================
+
+def read_sales(path, chunk_size=16 * 1024):
+    """Yield one int per line, reading `chunk_size` bytes at a time"""
+    leftover = b""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            lines = (leftover + chunk).split(b"\n")
+            leftover = lines.pop()         # last line may be cut in half
+            for line in lines:
+                if line.strip():
+                    yield int(line)
+    if leftover.strip():
+        yield int(leftover)
+
+
+# ============================================================================
+# Stage 2: composable filter / map stages
+# ============================================================================
+
+def keep(predicate):
+    """Filter stage: keep(lambda sale: sale > 5)"""
+    def stage(sales):
+        return (sale for sale in sales if predicate(sale))
+    return stage
+
+
+def transform(func):
+    """Map stage: transform(lambda sale: sale * 20)"""
+    def stage(sales):
+        return (func(sale) for sale in sales)
+    return stage
+
+
+def pipeline(source, *stages):
+    """Plug the stages together - still nothing is computed yet!"""
+    for stage in stages:
+        source = stage(source)
+    return source
+
+
+# ============================================================================
+# Stage 3: sum / min / max / count / histogram in ONE pass
+# ============================================================================
+
+class SalesStats:
+    """Consumes a stream once; memory = a few numbers + the histogram buckets"""
+
+    def __init__(self, bucket_size=5):
+        self.bucket_size = bucket_size
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+        self.histogram = {}            # bucket start -> how many sales
+
+    def consume(self, sales):
+        for sale in sales:
+            self.count += 1
+            self.total += sale
+            if self.min is None or sale < self.min:
+                self.min = sale
+            if self.max is None or sale > self.max:
+                self.max = sale
+            bucket = sale // self.bucket_size * self.bucket_size
+            self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+        return self
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+
+# ============================================================================
+# Same daily_sales as 04_generator_compre.py, but from a file
+# ============================================================================
+
+daily_sales = [5, 10, 12, 7, 3, 8, 9, 15]
+
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "sales.txt")
+    with open(path, "w") as f:
+        f.write("\n".join(map(str, daily_sales)))
+
+    # Same answer as sum(sale for sale in daily_sales if sale > 5)
+    print("Total cups:", sum(pipeline(read_sales(path), keep(lambda sale: sale > 5))))  # 61
+
+    stats = SalesStats().consume(pipeline(
+        read_sales(path, chunk_size=4),            # tiny chunks on purpose
+        keep(lambda sale: sale > 5),
+        transform(lambda cups: cups * 20),         # cups -> rupees
+    ))
+    print(f"Count: {stats.count}, Sum: {stats.total}, Min: {stats.min}, Max: {stats.max}")
+    print("Histogram:", dict(sorted(stats.histogram.items())))
+
+
+# ============================================================================
+# Benchmark: peak memory stays flat while the file grows
+# ============================================================================
+
+def benchmark():
+    print("\n=== Benchmark: streaming vs. reading the whole file ===")
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "sales.txt")
+        for lines in (20_000, 80_000, 320_000):
+            with open(path, "w") as f:
+                f.writelines(f"{i % 40}\n" for i in range(lines))
+
+            start = time.perf_counter()
+            SalesStats().consume(pipeline(read_sales(path), keep(lambda sale: sale > 5)))
+            elapsed = time.perf_counter() - start
+
+            # tracemalloc slows everything down, so measure memory in a separate run
+            tracemalloc.start()
+            SalesStats().consume(pipeline(read_sales(path), keep(lambda sale: sale > 5)))
+            stream_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            tracemalloc.start()
+            with open(path) as f:
+                everything = [int(line) for line in f]
+            SalesStats().consume([sale for sale in everything if sale > 5])
+            list_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            del everything
+
+            print(f"{lines:>7,} lines: streaming peak {stream_peak / 1024:>6,.0f} KiB "
+                  f"({lines / elapsed:,.0f} sales/sec) | list peak {list_peak / 1024:>6,.0f} KiB")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Read files in chunks; never call f.read() or readlines() on huge files
+- Each stage is a generator: it pulls one value, passes it on, forgets it
+- pipeline() only wires stages together - work starts when someone consumes
+- Compute every statistic in ONE pass instead of sum(), min(), max() each
+  re-reading the data
+- Streaming peak memory stays about the same size no matter how many lines
+"""
@@ -0,0 +1,237 @@
+"""
+BINARY, MEMORY-MAPPED SALES STORE
+
+05_streaming_sales.py streams a TEXT file. That keeps memory flat, but
+every line still has to be parsed: bytes -> str -> int. For big daily_sales
+jobs, that parsing is most of the work.
+
+Idea: store the numbers the way the computer already holds them.
+
+    +--------------------------- header (24 bytes) ---------------------------+
+    | b"CHAI" | version (2) | n_columns (2) | n_rows (8) | reserved (8)        |
+    +--------------------------------------------------------------------------+
+    | column names: n_columns x 16 bytes, padded with zeros                    |
+    +--------------------------------------------------------------------------+
+    | column 0: n_rows x 8-byte little-endian ints                             |
+    | column 1: ...                                                            |
+    +--------------------------------------------------------------------------+
+
+mmap lets the operating system page the file in on demand, and a
+memoryview over it reads the ints in place - no parsing, no copying.
+"""
+
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional - memoryview works without it
+    np = None
+
+MAGIC = b"CHAI"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQ8x")    # magic, version, n_columns, n_rows, padding
+NAME_SIZE = 16
+ITEM_SIZE = 8                         # every value is a little-endian int64
+
+
+# ============================================================================
+# Converter: list / text form -> binary file
+# ============================================================================
+
+def write_sales_store(path, columns):
+    """columns: {"cups": [5, 10, 12, ...], "shop": [...]} - all the same length"""
+    n_rows = len(next(iter(columns.values()), []))
+    # Check everything BEFORE writing, so a bad call never leaves a broken file
+    names = [name.encode() for name in columns]
+    for name, encoded in zip(columns, names):
+        if len(encoded) > NAME_SIZE:
+            raise ValueError(f"Column name {name!r} is {len(encoded)} bytes, max is {NAME_SIZE}")
+    for name, values in columns.items():
+        if len(values) != n_rows:
+            raise ValueError(f"Column {name!r} has {len(values)} rows, expected {n_rows}")
+    # Converting can fail too (floats, huge ints), so do it before open() as well
+    arrays = [array("q", values) for values in columns.values()]
+    if sys.byteorder == "big":
+        for data in arrays:
+            data.byteswap()           # the file is always little-endian
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(columns), n_rows))
+        for encoded in names:
+            f.write(encoded.ljust(NAME_SIZE, b"\0"))
+        for data in arrays:
+            f.write(data.tobytes())
+
+
+def convert_text_sales(text_path, store_path, column="cups"):
+    """One int per line (the format 05_streaming_sales.py reads)"""
+    with open(text_path) as f:
+        values = array("q", (int(line) for line in f if line.strip()))
+    write_sales_store(store_path, {column: values})
+
+
+# ============================================================================
+# Reader: mmap + zero-copy column views
+# ============================================================================
+
+class SalesStore:
+    """
+    with SalesStore(path) as store:
+        cups = store["cups"]            # memoryview (or NumPy array), no copy
+    """
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._views = []
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER.size:
+            self._file.close()
+            raise ValueError(f"{path} is too short to be a sales store")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n_columns, self.n_rows = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} sales store")
+
+        names_start = HEADER.size
+        data_start = names_start + n_columns * NAME_SIZE
+        expected = data_start + n_columns * self.n_rows * ITEM_SIZE
+        if size != expected:
+            self.close()
+            raise ValueError(f"{path} is {size} bytes, its header says {expected}")
+        self._offsets = {}
+        for i in range(n_columns):
+            raw = self._mmap[names_start + i * NAME_SIZE:names_start + (i + 1) * NAME_SIZE]
+            self._offsets[raw.rstrip(b"\0").decode()] = data_start + i * self.n_rows * ITEM_SIZE
+
+    def __getitem__(self, name):
+        start = self._offsets[name]
+        raw = memoryview(self._mmap)[start:start + self.n_rows * ITEM_SIZE]
+        self._views.append(raw)
+        if np is not None:
+            return np.frombuffer(raw, dtype="<i8")
+        if sys.byteorder == "big":
+            # Can't reinterpret in place on big-endian machines, so copy once
+            data = array("q", raw)
+            data.byteswap()
+            return memoryview(data)
+        column = raw.cast("q")
+        self._views.append(column)
+        return column
+
+    @property
+    def columns(self):
+        return list(self._offsets)
+
+    def close(self):
+        """
+        Views must be released before the mmap can be closed. If the caller
+        still holds a slice or NumPy array of a column, the mapping is left
+        open and freed once those are gone; the file itself is always closed.
+        """
+        try:
+            for view in reversed(self._views):
+                view.release()
+            self._views.clear()
+            self._mmap.close()
+        except BufferError:
+            pass                      # still exported - unmapped later by the GC
+        finally:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ============================================================================
+# Queries over the column: sum, filtered count, range scan
+# ============================================================================
+
+def total(column):
+    return int(column.sum()) if np is not None else sum(column)
+
+
+def count_above(column, threshold):
+    if np is not None:
+        return int((column > threshold).sum())
+    return sum(1 for sale in column if sale > threshold)
+
+
+def scan(column, start, stop):
+    """Rows start..stop - slicing a memoryview / NumPy array does NOT copy"""
+    return column[start:stop]
+
+
+daily_sales = [5, 10, 12, 7, 3, 8, 9, 15]
+
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "sales.chai")
+    write_sales_store(path, {"cups": daily_sales, "day": list(range(1, 9))})
+
+    with SalesStore(path) as store:
+        cups = store["cups"]
+        print("Columns:", store.columns)                     # ['cups', 'day']
+        print("Total cups:", total(cups))                     # 69
+        print("Days with more than 5 cups:", count_above(cups, 5))  # 6
+        print("Days 3-5:", list(scan(cups, 2, 5)))            # [12, 7, 3]
+        part = scan(cups, 2, 5)                               # still held when the store closes
+    print("Still readable after close():", list(part))       # [12, 7, 3]
+    del cups, part
+
+
+# ============================================================================
+# Benchmark: parsing text vs. reading the mmap'd column
+# ============================================================================
+
+def benchmark(rows=1_000_000):
+    print(f"\n=== Benchmark: {rows:,} sales ===")
+    with tempfile.TemporaryDirectory() as folder:
+        text_path = os.path.join(folder, "sales.txt")
+        store_path = os.path.join(folder, "sales.chai")
+        with open(text_path, "w") as f:
+            f.writelines(f"{i % 40}\n" for i in range(rows))
+        convert_text_sales(text_path, store_path)
+
+        start = time.perf_counter()
+        with open(text_path) as f:
+            text_total = sum(int(line) for line in f)
+        text_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with SalesStore(store_path) as store:
+            cups = store["cups"]
+            store_total = total(cups)
+            del cups
+        store_time = time.perf_counter() - start
+
+        assert text_total == store_total
+        size_mb = rows * ITEM_SIZE / 1e6
+        print(f"Text file: {text_time:.3f}s ({rows / text_time:>13,.0f} rows/sec)")
+        print(f"mmap store: {store_time:.3f}s ({rows / store_time:>13,.0f} rows/sec, "
+              f"{size_mb / store_time:,.0f} MB/s)")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Text needs parsing on every read; fixed-width binary does not
+- struct describes the header; array.array writes the int column in one go
+- mmap maps the file into memory; the OS loads pages only when touched
+- memoryview.cast("q") reads the ints in place (zero-copy); slicing it is free
+- With NumPy, np.frombuffer gives the same zero-copy view plus C-speed sums,
+  so no Python int objects are created at all
+- Release memoryviews before closing the mmap (otherwise BufferError);
+  if the caller still holds one, leave the mapping for the GC to free
+- Convert the data before opening the output, and check the file size
+  against the header when reading, so a half-written file is caught
+"""
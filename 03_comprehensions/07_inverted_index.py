@@ -0,0 +1,157 @@
+"""
+INVERTED INDEX: spice -> chais (instead of scanning every recipe)
+
+02_set_compre.py has recipes stored as chai -> spices:
+
+    recipes = {
+        'Masala Chai': ['ginger', 'cardamom', 'clove'],
+        ...
+    }
+
+To answer "which chais use clove?" we have to look at EVERY recipe:
+
+    {chai for chai, spices in recipes.items() if 'clove' in spices}
+
+An inverted index flips the dictionary around, once:
+
+    index = {
+        'clove':  {'Masala Chai', 'Elaichi Chai', 'Spicy Chai'},
+        'ginger': {...},
+        ...
+    }
+
+Now "which chais use clove?" is ONE dictionary lookup, and questions
+with several spices are just set operations:
+    AND -> intersection (&)    OR -> union (|)    NOT -> difference (-)
+"""
+
+import random
+import time
+
+_NONE = frozenset()
+
+# ============================================================================
+# The index
+# ============================================================================
+
+class SpiceIndex:
+    def __init__(self, recipes=None):
+        self._recipes = {}          # chai -> frozenset of spices (forward)
+        self._postings = {}         # spice -> set of chais (inverted)
+        for chai, spices in (recipes or {}).items():
+            self.add_recipe(chai, spices)
+
+    def add_recipe(self, chai, spices):
+        """Add a recipe, or replace it if the chai is already indexed"""
+        if chai in self._recipes:
+            self.remove_recipe(chai)
+        spices = frozenset(spices)
+        self._recipes[chai] = spices
+        for spice in spices:
+            self._postings.setdefault(spice, set()).add(chai)
+
+    def remove_recipe(self, chai):
+        """Only touches the postings of this chai's own spices"""
+        for spice in self._recipes.pop(chai):
+            chais = self._postings[spice]
+            chais.discard(chai)
+            if not chais:
+                del self._postings[spice]   # don't keep empty sets around
+
+    def chais_with(self, spice):
+        """A frozen copy - changing it can't corrupt the index"""
+        return frozenset(self._postings.get(spice, ()))
+
+    @property
+    def spices(self):
+        return self._postings.keys()        # same as unique_spices, for free
+
+    def query(self, all_of=(), any_of=(), none_of=()):
+        """
+        all_of:  chai must have EVERY one of these spices  (AND)
+        any_of:  chai must have AT LEAST ONE of these     (OR)
+        none_of: chai must have NONE of these              (NOT)
+        """
+        if all_of:
+            # Smallest set first: the result can only shrink, so starting
+            # small means every later & does less work
+            postings = sorted((self._postings.get(spice, _NONE) for spice in all_of), key=len)
+            result = set(postings[0])
+            for chais in postings[1:]:
+                if not result:
+                    break
+                result &= chais
+        else:
+            result = set(self._recipes)
+
+        if any_of:
+            result &= set().union(*(self._postings.get(spice, _NONE) for spice in any_of))
+        for spice in none_of:
+            result -= self._postings.get(spice, _NONE)
+        return result
+
+
+recipes = {
+    'Masala Chai': ['ginger', 'cardamom', 'clove'],
+    'Elaichi Chai': ['ginger', 'cardamom', 'clove'],
+    'Spicy Chai': ['ginger', 'black pepper', 'clove'],
+}
+
+index = SpiceIndex(recipes)
+print("Unique spices:", sorted(index.spices))
+print("Uses clove:", sorted(index.chais_with('clove')))
+try:
+    index.chais_with('clove').clear()
+except AttributeError:
+    print("chais_with() is read-only")         # the index can't be changed from outside
+print("ginger AND black pepper:", index.query(all_of=['ginger', 'black pepper']))  # {'Spicy Chai'}
+print("cardamom OR black pepper:", sorted(index.query(any_of=['cardamom', 'black pepper'])))
+print("black pepper, NOT cardamom:", index.query(any_of=['black pepper'], none_of=['cardamom']))  # {'Spicy Chai'}
+
+index.add_recipe('Tulsi Chai', ['tulsi', 'ginger'])
+print("ginger but NOT clove:", index.query(all_of=['ginger'], none_of=['clove']))  # {'Tulsi Chai'}
+
+index.remove_recipe('Spicy Chai')
+print("Uses black pepper after removing Spicy Chai:", index.chais_with('black pepper'))  # frozenset()
+
+
+# ============================================================================
+# Benchmark: index vs. brute-force comprehension
+# ============================================================================
+
+def benchmark(n_recipes=20_000, n_queries=100):
+    spice_pool = [f"spice_{i}" for i in range(300)]
+    rng = random.Random(42)
+    big_recipes = {f"Chai {i}": rng.sample(spice_pool, 5) for i in range(n_recipes)}
+    queries = [rng.sample(spice_pool[:20], 2) for _ in range(n_queries)]
+
+    start = time.perf_counter()
+    big_index = SpiceIndex(big_recipes)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    brute = [{chai for chai, spices in big_recipes.items() if all(s in spices for s in wanted)}
+             for wanted in queries]
+    brute_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [big_index.query(all_of=wanted) for wanted in queries]
+    index_time = time.perf_counter() - start
+
+    assert brute == fast                    # every query, not just the last one
+    print(f"\n=== Benchmark: {n_recipes:,} recipes, {n_queries} AND-queries ===")
+    print(f"Build index (once): {build_time:.3f}s")
+    print(f"Brute force:        {brute_time:.3f}s")
+    print(f"Inverted index:     {index_time:.4f}s ({brute_time / index_time:,.0f}x faster)")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Forward dict (chai -> spices) is good for "what's in this chai?"
+- Inverted dict (spice -> chais) is good for "which chais have this spice?"
+- Keep both, and update both together when a recipe is added or removed
+- AND = &, OR = |, NOT = - ... set algebra does the query work
+- Intersect the SMALLEST sets first: the result can never grow
+"""
@@ -0,0 +1,228 @@
+"""
+MENU QUERY ENGINE - precompute once, answer many times
+
+01_list_compre.py filters the menu like this:
+
+    iced_tea = [tea for tea in menu if 'Iced' in tea]
+    long_tea = [tea for tea in menu if len(tea) >= 12]
+
+Every query re-reads EVERY string. Fine for 5 teas; slow for 100,000 teas
+asked thousands of times.
+
+This engine does the expensive part ONCE, when an item is added:
+- its words (token set) go into a word -> items index
+- its length goes into a sorted list (so ">= 12" is a binary search)
+- its lowercase form is stored for case-insensitive substring search
+
+Queries are small predicate objects you can combine with & | ~ and the
+engine caches each query's answer until the menu changes.
+"""
+
+import bisect
+import random
+import time
+
+# ============================================================================
+# Predicates: small objects that describe a query (and can be combined)
+# ============================================================================
+
+class Predicate:
+    """Each predicate has a `key` (used for caching) and a way to find matching ids"""
+
+    def __and__(self, other):
+        return _Combine("&", self, other)
+
+    def __or__(self, other):
+        return _Combine("|", self, other)
+
+    def __invert__(self):
+        return _Not(self)
+
+
+class has_word(Predicate):
+    def __init__(self, word):
+        self.key = ("word", word.lower())
+
+    def ids(self, engine):
+        return engine._by_word.get(self.key[1], frozenset())
+
+
+class min_length(Predicate):
+    def __init__(self, length):
+        self.key = ("min_length", length)
+
+    def ids(self, engine):
+        start = bisect.bisect_left(engine._by_length, (self.key[1], -1))
+        return {item_id for _, item_id in engine._by_length[start:]}
+
+
+class contains(Predicate):
+    """Substring match - still a scan, but over precomputed lowercase forms"""
+
+    def __init__(self, text):
+        self.key = ("contains", text.lower())
+
+    def ids(self, engine):
+        text = self.key[1]
+        return {item_id for item_id, lower in engine._lower.items() if text in lower}
+
+
+class _Combine(Predicate):
+    def __init__(self, op, left, right):
+        self.op, self.left, self.right = op, left, right
+        self.key = (op, left.key, right.key)
+
+    def ids(self, engine):
+        left, right = engine._ids(self.left), engine._ids(self.right)
+        return left & right if self.op == "&" else left | right
+
+
+class _Not(Predicate):
+    def __init__(self, inner):
+        self.inner = inner
+        self.key = ("~", inner.key)
+
+    def ids(self, engine):
+        return engine._items.keys() - engine._ids(self.inner)
+
+
+# ============================================================================
+# The engine
+# ============================================================================
+
+class MenuQueryEngine:
+    def __init__(self, menu=()):
+        self._items = {}          # id -> original name (insertion order = menu order)
+        self._lower = {}          # id -> lowercase name
+        self._ids_by_name = {}    # name -> list of ids (the menu may repeat a tea)
+        self._by_word = {}        # lowercase word -> set of ids
+        self._by_length = []      # sorted list of (length, id)
+        self._cache = {}          # predicate key -> frozenset of ids
+        self._results = {}        # predicate key -> tuple of matching teas
+        self._next_id = 0
+        for tea in menu:
+            self._index(tea)
+        self._by_length.sort()    # sort once instead of insort per item
+
+    def _index(self, tea):
+        item_id = self._next_id
+        self._next_id += 1
+        self._items[item_id] = tea
+        self._lower[item_id] = tea.lower()
+        self._ids_by_name.setdefault(tea, []).append(item_id)
+        for word in set(tea.lower().split()):
+            self._by_word.setdefault(word, set()).add(item_id)
+        self._by_length.append((len(tea), item_id))
+        return item_id
+
+    def _invalidate(self):
+        # Menu changed -> any cached answer may be wrong
+        self._cache.clear()
+        self._results.clear()
+
+    def add(self, tea):
+        item_id = self._index(tea)
+        self._by_length.pop()
+        bisect.insort(self._by_length, (len(tea), item_id))
+        self._invalidate()
+        return item_id
+
+    def remove(self, tea):
+        """Remove one occurrence of tea (ValueError if it's not on the menu)"""
+        ids = self._ids_by_name.get(tea)
+        if not ids:
+            raise ValueError(f"{tea!r} is not on the menu")
+        item_id = ids.pop()
+        if not ids:
+            del self._ids_by_name[tea]
+        del self._items[item_id]
+        for word in set(self._lower.pop(item_id).split()):
+            ids = self._by_word[word]
+            ids.discard(item_id)
+            if not ids:
+                del self._by_word[word]     # don't keep empty sets around
+        # The list is sorted, so find the entry by bisection instead of a scan
+        del self._by_length[bisect.bisect_left(self._by_length, (len(tea), item_id))]
+        self._invalidate()
+
+    def _ids(self, predicate):
+        ids = self._cache.get(predicate.key)
+        if ids is None:
+            ids = self._cache[predicate.key] = frozenset(predicate.ids(self))
+        return ids
+
+    def query(self, predicate):
+        """Matching teas, in menu order"""
+        teas = self._results.get(predicate.key)
+        if teas is None:
+            ids = self._ids(predicate)
+            teas = self._results[predicate.key] = tuple(
+                self._items[item_id] for item_id in sorted(ids))
+        return list(teas)
+
+
+menu = [
+    'Masala Chai',
+    'Iced Lemon Chai',
+    'Ginger Chai',
+    'Kadak Chai',
+    'Iced Peach Chai'
+]
+
+engine = MenuQueryEngine(menu)
+print("Iced:", engine.query(has_word("Iced")))                     # same as iced_tea
+print("Long:", engine.query(min_length(12)))                       # same as long_tea
+print("Iced AND long:", engine.query(has_word("iced") & min_length(15)))
+print("NOT iced:", engine.query(~has_word("iced")))
+print("Contains 'ach':", engine.query(contains("ach")))            # Peach
+
+engine.add("Iced Masala Chai")
+print("Iced after adding a tea:", engine.query(has_word("Iced")))  # cache was invalidated
+
+
+# ============================================================================
+# Benchmark: repeated queries on a 100k-item menu
+# ============================================================================
+
+def benchmark(n_items=100_000, repeats=100):
+    rng = random.Random(3)
+    words = ["Iced", "Masala", "Ginger", "Lemon", "Peach", "Kadak", "Tulsi", "Rose", "Mint"]
+    big_menu = [f"{' '.join(rng.sample(words, rng.randint(1, 3)))} Chai {i}" for i in range(n_items)]
+
+    start = time.perf_counter()
+    big_engine = MenuQueryEngine(big_menu)
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        scan = [tea for tea in big_menu if 'Iced' in tea.split() and len(tea) >= 25]
+    scan_time = (time.perf_counter() - start) / repeats
+
+    query = has_word("Iced") & min_length(25)
+    start = time.perf_counter()
+    first = big_engine.query(query)            # first run fills the cache
+    first_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        cached = big_engine.query(query)
+    cached_time = (time.perf_counter() - start) / repeats
+
+    assert scan == first == cached
+    print(f"\n=== Benchmark: {n_items:,}-item menu, {len(cached):,} matches ===")
+    print(f"Build engine (once):     {build_time * 1000:8.1f} ms")
+    print(f"List comprehension scan: {scan_time * 1000:8.3f} ms per query")
+    print(f"Engine, first query:     {first_time * 1000:8.3f} ms")
+    print(f"Engine, cached query:    {cached_time * 1000:8.3f} ms per query")
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Move work from query time to insert time: tokens, lengths, lowercase forms
+- Word lookups use a dict of sets; length thresholds use bisect on a sorted list
+- Predicates combine with & | ~ and each one has a hashable key
+- Cache answers by key; clear the cache whenever the menu changes
+- Even the first (uncached) query only touches the matching ids, not every tea
+"""
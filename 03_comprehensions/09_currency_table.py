@@ -0,0 +1,217 @@
+"""
+PRICE CONVERSION SERVICE - convert once, reuse, update only what changed
+
+03_dict_compre.py converts prices like this:
+
+    teac_prices_usd = {tea: price / 88 for tea, price in tea_prices_inr.items() if price >= 28}
+
+Every run divides EVERY price by a hard-coded 88. With many currencies,
+a big price book and rates that change a few times a day, most of that
+work repeats answers we already had.
+
+This service keeps:
+- RateTable:  currency -> rate, each currency with its own version number
+- PriceBook:  tea -> INR price, with a version and "which teas changed when"
+- a cache:    book -> (currency, exact?) -> converted book + the versions used
+              (keyed by the book OBJECT, so two books named "main" never mix)
+
+On each request:
+- nothing changed          -> return the cached book
+- only some prices changed -> re-convert just those teas
+- the rate changed         -> re-convert everything (in one bulk pass)
+"""
+
+import bisect
+import random
+import time
+import weakref
+from decimal import ROUND_HALF_UP, Decimal
+from itertools import repeat
+from operator import truediv
+from types import MappingProxyType
+
+# ============================================================================
+# Versioned inputs
+# ============================================================================
+
+class RateTable:
+    """rates are 'INR per 1 unit of currency', e.g. USD -> 88"""
+
+    def __init__(self, rates=None):
+        self._rates = {}
+        self._versions = {}
+        for currency, rate in (rates or {}).items():
+            self.set_rate(currency, rate)
+
+    def set_rate(self, currency, inr_per_unit):
+        self._rates[currency] = inr_per_unit
+        self._versions[currency] = self._versions.get(currency, 0) + 1
+
+    def rate(self, currency):
+        return self._rates[currency]           # KeyError for unknown currencies
+
+    def version(self, currency):
+        return self._versions[currency]
+
+
+class PriceBook:
+    def __init__(self, name, prices=None):
+        self.name = name
+        self.version = 0
+        self._prices = dict(prices or {})
+        self._log = []            # (version, tea) for every change, oldest first
+
+    def set_price(self, tea, inr):
+        self.version += 1
+        self._prices[tea] = inr
+        self._log.append((self.version, tea))
+
+    def remove(self, tea):
+        self.version += 1
+        del self._prices[tea]
+        self._log.append((self.version, tea))   # remember the removal too
+
+    def changed_since(self, version):
+        """Teas changed after `version` - binary search, no full scan"""
+        start = bisect.bisect_right(self._log, version, key=lambda entry: entry[0])
+        return {tea for _, tea in self._log[start:]}
+
+    def items(self):
+        return self._prices.items()
+
+    def get(self, tea):
+        return self._prices.get(tea)
+
+
+# ============================================================================
+# Bulk conversion (float or exact Decimal)
+# ============================================================================
+
+CENT = Decimal("0.01")
+
+def convert_prices(prices, rate, exact=False):
+    """prices: {tea: inr} -> {tea: converted}, in one bulk pass"""
+    if exact:
+        rate = Decimal(str(rate))
+        return {tea: (Decimal(str(inr)) / rate).quantize(CENT, ROUND_HALF_UP)
+                for tea, inr in prices.items()}
+    # map(truediv, ...) divides the whole column without a Python-level loop body
+    return dict(zip(prices.keys(), map(truediv, prices.values(), repeat(rate))))
+
+
+# ============================================================================
+# The service with its cache
+# ============================================================================
+
+class ConversionService:
+    def __init__(self, rates):
+        self.rates = rates
+        # book -> {(currency, exact): (book version, rate version, prices)};
+        # weak keys, so a book that's thrown away takes its cache entries with it
+        self._cache = weakref.WeakKeyDictionary()
+        self.stats = {"hits": 0, "partial": 0, "full": 0}
+
+    def convert(self, book, currency, exact=False):
+        """Returns a READ-ONLY view of the converted prices (the cache's own dict)"""
+        slots = self._cache.setdefault(book, {})
+        key = (currency, exact)
+        rate_version = self.rates.version(currency)
+        cached = slots.get(key)
+
+        if cached and cached[1] == rate_version:
+            book_version, _, converted = cached
+            if book_version == book.version:
+                self.stats["hits"] += 1
+                return MappingProxyType(converted)
+            # Same rate, some prices changed: redo only those teas
+            self.stats["partial"] += 1
+            converted = dict(converted)        # don't mutate what callers already hold
+            changed = {}
+            for tea in book.changed_since(book_version):
+                inr = book.get(tea)
+                if inr is None:
+                    converted.pop(tea, None)
+                else:
+                    changed[tea] = inr
+            converted.update(convert_prices(changed, self.rates.rate(currency), exact))
+        else:
+            self.stats["full"] += 1
+            converted = convert_prices(dict(book.items()), self.rates.rate(currency), exact)
+
+        slots[key] = (book.version, rate_version, converted)
+        return MappingProxyType(converted)       # callers can't change the cached dict
+
+
+tea_prices_inr = {
+    "Masala Chai": 20,
+    "Iced Lemon Chai": 25,
+    "Ginger Chai": 30,
+    "Kadak Chai": 35,
+    "Iced Peach Chai": 40
+}
+
+rates = RateTable({"USD": 88, "EUR": 95, "GBP": 111})
+book = PriceBook("main", tea_prices_inr)
+service = ConversionService(rates)
+
+usd = service.convert(book, "USD")
+teac_prices_usd = {tea: price for tea, price in usd.items() if tea_prices_inr[tea] >= 28}
+print("USD (price >= 28 INR):", teac_prices_usd)                # same as 03_dict_compre.py
+print("EUR, exact:", dict(service.convert(book, "EUR", exact=True)))  # Decimal, rounded to cents
+
+book.set_price("Kadak Chai", 45)
+print("Kadak in USD after price change:", service.convert(book, "USD")["Kadak Chai"])
+service.convert(book, "USD")                                    # nothing changed -> cache hit
+rates.set_rate("USD", 90)
+print("Kadak in USD after rate change:", service.convert(book, "USD")["Kadak Chai"])
+print("Cache stats:", service.stats)                            # 1 hit, 1 partial, 3 full
+
+other = PriceBook("main", {"Tulsi Chai": 176})                 # same name, different book
+print("Other 'main' book:", dict(service.convert(other, "USD")))  # its own prices, not book's
+try:
+    usd["Masala Chai"] = 0                                      # results are read-only
+except TypeError as error:
+    print("TypeError:", error)
+
+
+# ============================================================================
+# Benchmark: 100k-tea book, a few price updates between requests
+# ============================================================================
+
+def benchmark(n_teas=100_000, requests=50):
+    rng = random.Random(11)
+    big_book = PriceBook("big", {f"Chai {i}": rng.randint(10, 200) for i in range(n_teas)})
+    big_service = ConversionService(RateTable({"USD": 88}))
+    big_service.convert(big_book, "USD")
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        big_book.set_price(f"Chai {rng.randrange(n_teas)}", rng.randint(10, 200))
+        rebuilt = {tea: price / 88 for tea, price in big_book.items()}
+    comprehension_time = (time.perf_counter() - start) / requests
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        big_book.set_price(f"Chai {rng.randrange(n_teas)}", rng.randint(10, 200))
+        converted = big_service.convert(big_book, "USD")
+    service_time = (time.perf_counter() - start) / requests
+
+    assert converted == {tea: price / 88 for tea, price in big_book.items()}
+    print(f"\n=== Benchmark: {n_teas:,} teas, 1 price change per request ===")
+    print(f"Dict comprehension every time: {comprehension_time * 1000:7.2f} ms per request")
+    print(f"ConversionService:             {service_time * 1000:7.2f} ms per request")
+    del rebuilt
+
+benchmark()
+
+
+"""
+KEY POINTS:
+- Don't hard-code rates; keep them in a table with a version per currency
+- Cache converted books keyed by WHAT they were computed from
+  (the book object, currency, exact) plus the versions of book and rate
+- When only a few prices change, patch just those entries
+- Use Decimal (with quantize) when money must be exact; floats are faster
+- Copying the cached dict before patching keeps old results safe for callers;
+  handing out a read-only view (MappingProxyType) keeps the cache safe from them
+"""
@@ -0,0 +1,197 @@
+# =============================================================================
+# BITSETS - Sets of small symbols packed into a single int
+# =============================================================================
+# A normal set of strings stores a hash table + a pointer per element.
+# If every element comes from a KNOWN catalog (spices, chai names, ...),
+# we can give each symbol a number and store the set as bits of ONE int:
+#
+#   symbols:  ginger=0  cardamom=1  clove=2  black pepper=3
+#   {'ginger', 'clove'}  ->  0b0101  ->  5
+#
+# Set algebra then becomes integer bit operations, done in C, a whole
+# machine word (64 symbols) at a time:
+#   union |   intersection &   difference & ~   symmetric difference ^
+
+import random
+import sys
+import time
+
+# -----------------------------------------------------------------------------
+# 1. SYMBOL TABLE - interning: name <-> bit position
+# -----------------------------------------------------------------------------
+class SymbolTable:
+    def __init__(self, names=()):
+        self._index = {}                 # name -> bit position
+        self._names = []                 # bit position -> name
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name):
+        """Return the bit position for name, assigning a new one if needed"""
+        bit = self._index.get(name)
+        if bit is None:
+            bit = self._index[name] = len(self._names)
+            self._names.append(sys.intern(name))
+        return bit
+
+    def bit(self, name):
+        return self._index[name]         # KeyError for unknown symbols
+
+    def name(self, bit):
+        return self._names[bit]
+
+    def __len__(self):
+        return len(self._names)
+
+
+# -----------------------------------------------------------------------------
+# 2. BITSET - same operator surface as set/frozenset
+# -----------------------------------------------------------------------------
+class BitSet:
+    __slots__ = ("symbols", "bits")      # no per-object __dict__
+
+    def __init__(self, symbols, names=(), bits=0):
+        self.symbols = symbols
+        for name in names:
+            bits |= 1 << symbols.intern(name)
+        self.bits = bits
+
+    def _new(self, bits):
+        return BitSet(self.symbols, bits=bits)
+
+    def _other_bits(self, other):
+        if other.symbols is not self.symbols:
+            raise ValueError("BitSets must share the same SymbolTable")
+        return other.bits
+
+    # Operators (return NEW BitSets, like frozenset)
+    def __or__(self, other):
+        return self._new(self.bits | self._other_bits(other))
+
+    def __and__(self, other):
+        return self._new(self.bits & self._other_bits(other))
+
+    def __sub__(self, other):
+        return self._new(self.bits & ~self._other_bits(other))
+
+    def __xor__(self, other):
+        return self._new(self.bits ^ self._other_bits(other))
+
+    union, intersection = __or__, __and__
+    difference, symmetric_difference = __sub__, __xor__
+
+    # Comparisons
+    def issubset(self, other):
+        return self.bits & ~self._other_bits(other) == 0
+
+    def issuperset(self, other):
+        return other.issubset(self)
+
+    def isdisjoint(self, other):
+        return self.bits & self._other_bits(other) == 0
+
+    __le__, __ge__ = issubset, issuperset
+
+    def __lt__(self, other):
+        return self.issubset(other) and self.bits != other.bits
+
+    def __eq__(self, other):
+        return isinstance(other, BitSet) and self.symbols is other.symbols and self.bits == other.bits
+
+    def __hash__(self):
+        return hash(self.bits)
+
+    # Membership, size, iteration
+    def __contains__(self, name):
+        bit = self.symbols._index.get(name)
+        return bit is not None and self.bits >> bit & 1 == 1
+
+    def __len__(self):
+        return self.bits.bit_count()     # popcount (Python 3.10+)
+
+    def __iter__(self):
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits        # isolate the lowest set bit
+            yield self.symbols.name(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    def __repr__(self):
+        return "BitSet({" + ", ".join(map(repr, self)) + "})"
+
+
+# -----------------------------------------------------------------------------
+# 3. USING IT - the same examples as sets.py and 02_set_compre.py
+# -----------------------------------------------------------------------------
+letters = SymbolTable("abcde")
+set1 = BitSet(letters, {"a", "b", "c"})
+set2 = BitSet(letters, {"a", "d", "e"})
+
+print(set1 | set2)                       # Union: {'a', 'b', 'c', 'd', 'e'}
+print(set1 & set2)                       # Intersection: {'a'}
+print(set1 - set2)                       # Difference: {'b', 'c'}
+print(set1 ^ set2)                       # Symmetric difference: {'b', 'c', 'd', 'e'}
+print(BitSet(letters, "ab") <= set1)     # True - subset
+print(set1.isdisjoint(BitSet(letters, "de")))  # True
+
+spices = SymbolTable()
+recipes = {
+    'Masala Chai': BitSet(spices, ['ginger', 'cardamom', 'clove']),
+    'Elaichi Chai': BitSet(spices, ['ginger', 'cardamom', 'clove']),
+    'Spicy Chai': BitSet(spices, ['ginger', 'black pepper', 'clove']),
+}
+all_spices = BitSet(spices)
+for spice_set in recipes.values():
+    all_spices |= spice_set
+print("Unique spices:", sorted(all_spices), "stored as", bin(all_spices.bits))  # 0b1111
+
+
+# -----------------------------------------------------------------------------
+# 4. BENCHMARK - memory and throughput vs set / frozenset
+# -----------------------------------------------------------------------------
+def benchmark(n_recipes=5_000, catalog_size=200, spices_per_recipe=8):
+    rng = random.Random(7)
+    catalog = [f"spice_{i}" for i in range(catalog_size)]
+    table = SymbolTable(catalog)
+    raw = [rng.sample(catalog, spices_per_recipe) for _ in range(n_recipes)]
+    frozen = [frozenset(r) for r in raw]
+    bitsets = [BitSet(table, r) for r in raw]
+
+    # Per-recipe container size (the interned strings are shared by both)
+    frozen_bytes = sum(sys.getsizeof(s) for s in frozen) / n_recipes
+    bitset_bytes = sum(sys.getsizeof(b) + sys.getsizeof(b.bits) for b in bitsets) / n_recipes
+    print(f"\n=== Benchmark: {n_recipes:,} recipes, {catalog_size} spice catalog ===")
+    print(f"Memory per recipe: frozenset {frozen_bytes:.0f} bytes, BitSet {bitset_bytes:.0f} bytes "
+          f"(raw int only: {sum(sys.getsizeof(b.bits) for b in bitsets) / n_recipes:.0f})")
+
+    for label, items in (("frozenset", frozen), ("BitSet", bitsets)):
+        start = time.perf_counter()
+        union = items[0]
+        for s in items:
+            union = union | s
+        pairs = sum(1 for a, b in zip(items, items[1:]) if not a.isdisjoint(b))
+        elapsed = time.perf_counter() - start
+        print(f"{label:>9}: union + {n_recipes:,} disjoint checks in {elapsed * 1000:.1f} ms "
+              f"({len(union)} spices, {pairs} overlapping pairs)")
+
+    # The raw-int loop shows the ceiling once the Python wrapper is gone
+    ints = [b.bits for b in bitsets]
+    start = time.perf_counter()
+    union_bits = 0
+    for bits in ints:
+        union_bits |= bits
+    elapsed = time.perf_counter() - start
+    print(f"  raw int: union in {elapsed * 1000:.1f} ms ({union_bits.bit_count()} spices)")
+
+benchmark()
+
+# -----------------------------------------------------------------------------
+# 5. KEY POINTS TO REMEMBER
+# -----------------------------------------------------------------------------
+# - Only works when elements come from a known, numbered catalog (SymbolTable)
+# - One int holds the whole set: a 200-spice catalog fits in ~50 bytes
+# - | & ^ on ints work a whole machine word at a time
+# - a - b for bitsets is a & ~b
+# - Subset test: a & ~b == 0 ; disjoint test: a & b == 0
+# - int.bit_count() gives len(); lowest set bit is x & -x
+# - BitSets from DIFFERENT symbol tables must not be mixed
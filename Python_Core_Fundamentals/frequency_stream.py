@@ -0,0 +1,276 @@
+# =============================================================================
+# FREQUENCY STREAMS - Counting words/letters in text that never stops
+# =============================================================================
+# dictionary.py and strings.py count a WHOLE input that is already in memory:
+#
+#   Counter(words)            Counter("hello")
+#
+# Order notes arrive as an endless stream, so here we count chunk by chunk:
+#   - StreamCounter: exact counts, fed one chunk at a time
+#   - SlidingWindowCounter: counts for the last N chunks only
+#   - count_parallel: each worker process counts its share, then we MERGE
+#   - CountMinSketch / SpaceSaving: approximate counts in FIXED memory
+
+import heapq
+import random
+import re
+import sys
+import time
+from collections import Counter, deque
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from zlib import adler32, crc32
+
+WORD = re.compile(r"[a-z0-9']+")
+TAIL = re.compile(r"[a-z0-9']+\Z", re.IGNORECASE)     # a word touching the chunk's end
+
+
+# -----------------------------------------------------------------------------
+# 1. STREAMCOUNTER - exact counts, one chunk at a time
+# -----------------------------------------------------------------------------
+def tokenize(text, unit="word"):
+    """unit="word" -> lowercase words, unit="letter" -> letters only"""
+    text = text.lower()
+    if unit == "letter":
+        return filter(str.isalpha, text)
+    return WORD.findall(text)
+
+
+class StreamCounter:
+    def __init__(self, unit="word"):
+        self.unit = unit
+        self.counts = Counter()
+        self._tail = ""                  # half a word left over from the last chunk
+
+    def feed(self, chunk):
+        if self.unit == "word":
+            # A chunk can end in the middle of a word: keep that piece for later
+            chunk = self._tail + chunk
+            tail = TAIL.search(chunk)
+            cut = tail.start() if tail else len(chunk)
+            chunk, self._tail = chunk[:cut], chunk[cut:]
+        self.counts.update(tokenize(chunk, self.unit))   # Counter.update ADDS counts
+
+    def flush(self):
+        """End of stream: count the leftover word"""
+        if self._tail:
+            self.counts.update(tokenize(self._tail, self.unit))
+            self._tail = ""
+        return self.counts
+
+    def most_common(self, n=None):
+        return self.counts.most_common(n)
+
+
+# -----------------------------------------------------------------------------
+# 2. SLIDINGWINDOWCOUNTER - only the last `window` chunks count
+# -----------------------------------------------------------------------------
+class SlidingWindowCounter:
+    def __init__(self, window, unit="word"):
+        self.window = window
+        self.unit = unit
+        self.counts = Counter()
+        self._chunks = deque()           # per-chunk Counters, oldest on the left
+
+    def feed(self, chunk):
+        # Chunks are whole notes here, so no half-word bookkeeping is needed
+        fresh = Counter(tokenize(chunk, self.unit))
+        self._chunks.append(fresh)
+        self.counts.update(fresh)
+        if len(self._chunks) > self.window:
+            self._expire(self._chunks.popleft())
+
+    def _expire(self, old):
+        # Decrement only the keys the expired chunk touched - not the whole Counter
+        counts = self.counts
+        for token, n in old.items():
+            left = counts[token] - n
+            if left:
+                counts[token] = left
+            else:
+                del counts[token]         # keep the Counter small: no zero entries
+
+    def most_common(self, n=None):
+        return self.counts.most_common(n)
+
+
+# -----------------------------------------------------------------------------
+# 3. MERGING PER-WORKER COUNTERS (process pool)
+# -----------------------------------------------------------------------------
+def _count_notes(notes, unit):
+    counts = Counter()
+    for note in notes:
+        counts.update(tokenize(note, unit))
+    return counts
+
+
+def count_parallel(notes, workers=2, unit="word", batch=10_000):
+    """Each worker counts whole batches of notes; the Counters are summed"""
+    batches = [notes[i:i + batch] for i in range(0, len(notes), batch)]
+    total = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for partial in pool.map(_count_notes, batches, [unit] * len(batches)):
+            total.update(partial)        # merge: counts add up
+    return total
+
+
+# -----------------------------------------------------------------------------
+# 4. APPROXIMATE COUNTING IN FIXED MEMORY
+# -----------------------------------------------------------------------------
+def _hashes(token):
+    # crc32/adler32 give the SAME numbers in every process (hash() does not),
+    # so sketches built by different workers can be merged
+    data = token.encode()
+    return crc32(data), adler32(data) | 1
+
+
+class CountMinSketch:
+    """depth rows of width counters; estimate = smallest of the depth cells.
+    Never undercounts; overcounts by at most ~ total / width * e (usually)"""
+
+    def __init__(self, width=2048, depth=4):
+        self.width = width
+        self.depth = depth
+        self.table = array("q", bytes(8 * width * depth))
+        self.total = 0
+
+    def _cells(self, token):
+        h1, h2 = _hashes(token)
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, token, count=1):
+        table = self.table
+        for cell in self._cells(token):
+            table[cell] += count
+        self.total += count
+
+    def update(self, counts):
+        """Add a whole chunk's Counter: one sketch update per DISTINCT token"""
+        for token, n in counts.items():
+            self.add(token, n)
+
+    def estimate(self, token):
+        table = self.table
+        return min(table[cell] for cell in self._cells(token))
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Can only merge sketches of the same shape")
+        self.table = array("q", map(int.__add__, self.table, other.table))
+        self.total += other.total
+
+
+class SpaceSaving:
+    """Keeps at most k tokens. A new token replaces the smallest one and
+    inherits its count (+n), so frequent tokens can never be pushed out"""
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counts = {}
+        self.errors = {}                 # how much of a count may be inherited
+        self._heap = []                  # (count, token); stale entries skipped later
+
+    def update(self, counts):
+        tracked, errors, heap = self.counts, self.errors, self._heap
+        for token, n in counts.items():
+            if token in tracked:
+                tracked[token] += n
+            elif len(tracked) < self.k:
+                tracked[token] = n
+                errors[token] = 0
+            else:
+                # Smallest tracked token: pop until an entry is still current
+                while True:
+                    floor, smallest = heapq.heappop(heap)
+                    if tracked.get(smallest) == floor:
+                        break
+                del tracked[smallest], errors[smallest]
+                tracked[token] = floor + n
+                errors[token] = floor
+            heapq.heappush(heap, (tracked[token], token))
+        if len(heap) > 4 * self.k:       # too many stale entries: rebuild
+            heap[:] = [(count, token) for token, count in tracked.items()]
+            heapq.heapify(heap)
+
+    def most_common(self, n=None):
+        return sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:n]
+
+
+# -----------------------------------------------------------------------------
+# 5. DEMO & BENCHMARK
+# -----------------------------------------------------------------------------
+def order_notes(n_notes, vocabulary=20_000, seed=7):
+    """Fake order notes: a few words are very common, most are rare (Zipf-like)"""
+    rng = random.Random(seed)
+    common = ["masala", "chai", "ginger", "less", "sugar", "extra", "hot", "elaichi"]
+    words = common + [f"word{i}" for i in range(vocabulary)]
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    picked = rng.choices(words, weights, k=8 * n_notes)
+    return [" ".join(picked[i:i + 8]) for i in range(0, len(picked), 8)]
+
+
+if __name__ == "__main__":
+    stream = StreamCounter()
+    for chunk in ("masala chai, less sug", "ar; ginger chai, extra su", "gar"):
+        stream.feed(chunk)               # words split across chunks still count once
+    print(stream.flush())                # {'chai': 2, 'sugar': 2, 'masala': 1, ...}
+
+    letters = StreamCounter(unit="letter")
+    letters.feed("hel")
+    letters.feed("lo")
+    print(letters.flush())               # {'l': 2, 'h': 1, 'e': 1, 'o': 1} - same as Counter("hello")
+
+    window = SlidingWindowCounter(window=2)
+    for note in ("masala chai", "ginger chai", "ginger tea"):
+        window.feed(note)
+    print(window.most_common())          # [('ginger', 2), ('chai', 1), ('tea', 1)] - "masala" expired
+
+    notes = order_notes(100_000)
+    tokens = sum(len(note.split()) for note in notes)
+
+    # Exact, one process vs. merged per-worker Counters
+    start = time.perf_counter()
+    exact = _count_notes(notes, "word")
+    single = time.perf_counter() - start
+    start = time.perf_counter()
+    merged = count_parallel(notes, workers=2)
+    parallel = time.perf_counter() - start
+    assert merged == exact
+
+    print(f"\n=== Benchmark: {len(notes):,} notes, {tokens:,} words, {len(exact):,} distinct ===")
+    print(f"Exact Counter, 1 process:   {tokens / single / 1e6:.2f}M words/s")
+    print(f"Exact Counter, 2 processes: {tokens / parallel / 1e6:.2f}M words/s (merged)")
+
+    # Approximate: feed per-chunk Counters so each distinct word costs one update
+    sketch, top = CountMinSketch(width=4096, depth=4), SpaceSaving(k=200)
+    start = time.perf_counter()
+    for i in range(0, len(notes), 1_000):
+        chunk = _count_notes(notes[i:i + 1_000], "word")
+        sketch.update(chunk)
+        top.update(chunk)
+    approx = time.perf_counter() - start
+
+    exact_top = exact.most_common(20)
+    overcount = sum(sketch.estimate(w) - c for w, c in exact_top) / sum(c for _, c in exact_top)
+    found = len({w for w, _ in exact_top} & {w for w, _ in top.most_common(20)})
+    print(f"Sketch + Space-Saving:      {tokens / approx / 1e6:.2f}M words/s")
+    print(f"Top-20 words: Count-Min overcount {overcount:.2%}, Space-Saving found {found}/20")
+
+    counter_bytes = sys.getsizeof(exact) + sum(sys.getsizeof(w) for w in exact)
+    sketch_bytes = sys.getsizeof(sketch.table)
+    print(f"Memory: exact Counter ~{counter_bytes / 1024:.0f} KiB (grows with vocabulary), "
+          f"sketch {sketch_bytes / 1024:.0f} KiB (fixed)")
+
+# -----------------------------------------------------------------------------
+# 6. KEY POINTS TO REMEMBER
+# -----------------------------------------------------------------------------
+# - Counter.update() ADDS counts, so counting chunk by chunk == counting it all
+# - Chunks can split words: carry the unfinished word into the next chunk
+# - Sliding window = remember each chunk's Counter, subtract it when it expires
+#   (delete keys that reach 0 so the Counter doesn't grow forever)
+# - Counters from different processes merge by adding them up
+# - Count-Min Sketch: fixed memory, never undercounts, good for "how many X?"
+# - Space-Saving: keeps only k tokens, good for "what are the top words?"
+# - Pre-counting a chunk with Counter makes sketch updates per DISTINCT word
+# - Use hashes that are stable across processes (crc32), not hash()
@@ -0,0 +1,305 @@
+# =============================================================================
+# GROUP BY - The by_grade pattern from dictionary.py, scaled up
+# =============================================================================
+# dictionary.py section 13 groups records one at a time:
+#
+#   by_grade = defaultdict(list)
+#   for s in students:
+#       by_grade[s["grade"]].append(s["name"])
+#
+# group_by() does the same for many records and more aggregates:
+#   count, sum, mean, list, set   (one result per key)
+#
+# - workers > 1: records are split by hash(key) so every key lands in exactly
+#   ONE partition; each worker process aggregates its partition as batches
+#   of records stream in (the input is never held in memory all at once)
+# - max_groups: if a partition has more keys than that, the worker stops
+#   holding them all in a dict, writes sorted partial results to temp files
+#   and merges the files back in key order (an external sort)
+
+import heapq
+import multiprocessing
+import os
+import pickle
+import queue
+import random
+import tempfile
+import time
+from itertools import chain, groupby
+from operator import itemgetter
+
+
+# -----------------------------------------------------------------------------
+# 1. AGGREGATES - start / step / merge / finish for each kind
+# -----------------------------------------------------------------------------
+def _append(values, value):
+    values.append(value)
+    return values
+
+
+def _add(values, value):
+    values.add(value)
+    return values
+
+
+def _extend(a, b):
+    a.extend(b)
+    return a
+
+
+def _union(a, b):
+    a |= b
+    return a
+
+
+# name: (first value -> state, (state, value) -> state, (state, state) -> state, state -> result)
+AGGREGATES = {
+    "count": (lambda v: 1, lambda s, v: s + 1, int.__add__, lambda s: s),
+    "sum": (lambda v: v, lambda s, v: s + v, lambda a, b: a + b, lambda s: s),
+    "mean": (lambda v: (v, 1), lambda s, v: (s[0] + v, s[1] + 1),
+             lambda a, b: (a[0] + b[0], a[1] + b[1]), lambda s: s[0] / s[1]),
+    "list": (lambda v: [v], _append, _extend, lambda s: s),
+    "set": (lambda v: {v}, _add, _union, lambda s: s),
+}
+
+
+# -----------------------------------------------------------------------------
+# 2. ONE PARTITION: in memory, or spilled to sorted runs on disk
+# -----------------------------------------------------------------------------
+def _write_run(groups, spill_dir):
+    """Save one batch of partial results, sorted by key, to a temp file"""
+    fd, path = tempfile.mkstemp(suffix=".run", dir=spill_dir)
+    with os.fdopen(fd, "wb") as f:
+        items = sorted(groups.items(), key=itemgetter(0))
+        for i in range(0, len(items), 1_000):
+            pickle.dump(items[i:i + 1_000], f)
+    return path
+
+
+def _read_run(path):
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield from pickle.load(f)
+            except EOFError:
+                return
+
+
+def _aggregate(pairs, agg, max_groups=None, spill_dir=None):
+    """
+    pairs: (key, value) tuples. Returns ("memory", [(key, result), ...]) or,
+    if more than max_groups keys showed up, ("file", path) holding the
+    results sorted by key.
+    """
+    start, step, merge, finish = AGGREGATES[agg]
+    groups = {}
+    runs = []
+    for key, value in pairs:
+        if key in groups:
+            groups[key] = step(groups[key], value)
+        else:
+            if max_groups is not None and len(groups) >= max_groups:
+                runs.append(_write_run(groups, spill_dir))      # spill and start fresh
+                groups = {}
+            groups[key] = start(value)
+
+    if not runs:
+        return "memory", [(key, finish(state)) for key, state in groups.items()]
+
+    # External merge: the same key may appear once per run, always in key order
+    runs.append(_write_run(groups, spill_dir))
+    del groups
+    merged = heapq.merge(*map(_read_run, runs), key=itemgetter(0))
+    fd, path = tempfile.mkstemp(suffix=".groups", dir=spill_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            batch = []
+            for key, partials in groupby(merged, key=itemgetter(0)):
+                _, state = next(partials)
+                for _, other in partials:
+                    state = merge(state, other)
+                batch.append((key, finish(state)))
+                if len(batch) == 1_000:
+                    pickle.dump(batch, f)
+                    batch = []
+            pickle.dump(batch, f)
+    finally:
+        for run in runs:
+            os.remove(run)
+    return "file", path
+
+
+def _results(kind, payload):
+    if kind == "memory":
+        yield from payload
+        return
+    try:
+        yield from _read_run(payload)
+    finally:
+        os.remove(payload)
+
+
+# -----------------------------------------------------------------------------
+# 3. GROUP_BY - hash partitioning across worker processes
+# -----------------------------------------------------------------------------
+def _partition_worker(index, inbox, outbox, agg, max_groups, spill_dir):
+    # Batches of pairs arrive until the None sentinel; aggregate as they come
+    pairs = chain.from_iterable(iter(inbox.get, None))
+    try:
+        outbox.put((index, _aggregate(pairs, agg, max_groups, spill_dir)))
+    except Exception as error:
+        outbox.put((index, ("error", error)))     # the parent re-raises it
+
+
+def _receive(outbox, processes, outputs):
+    """Store one worker's output; raise its error, or fail if it died silently"""
+    while True:
+        try:
+            index, output = outbox.get(timeout=0.1)
+            break
+        except queue.Empty:
+            dead = [i for i, process in enumerate(processes)
+                    if i not in outputs and process.exitcode is not None]
+            if dead:
+                try:                              # a last result may still be in the pipe
+                    index, output = outbox.get(timeout=1)
+                    break
+                except queue.Empty:
+                    raise RuntimeError(f"group_by worker {dead[0]} exited with code "
+                                       f"{processes[dead[0]].exitcode}") from None
+    outputs[index] = output
+    if output[0] == "error":
+        raise output[1]
+
+
+def _send(inbox, item, process, outbox, processes, outputs):
+    """inbox.put() that stops waiting once the worker can no longer read"""
+    while True:
+        try:
+            inbox.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            if not process.is_alive():
+                while True:
+                    _receive(outbox, processes, outputs)   # raises the worker's error
+
+
+def group_by(records, key, value=None, agg="list", workers=1, max_groups=None,
+             spill_dir=None, batch=10_000):
+    """
+    records: dicts (any iterable - it is read once, never loaded whole).
+    key / value: field names (value not needed for "count").
+    Yields (key, result) pairs - wrap in dict() for a by_grade-style dict.
+    Keys that spill to disk come out sorted, so they must be comparable.
+    """
+    if agg not in AGGREGATES:
+        raise ValueError(f"Unknown aggregate {agg!r}, choose from {sorted(AGGREGATES)}")
+    pairs = ((r[key], r[value] if value is not None else None) for r in records)
+
+    if workers <= 1:
+        yield from _results(*_aggregate(pairs, agg, max_groups, spill_dir))
+        return
+
+    # One long-lived process per partition, fed in batches through a small
+    # queue: memory holds a few batches, not the whole input
+    outbox = multiprocessing.Queue()
+    inboxes = [multiprocessing.Queue(maxsize=4) for _ in range(workers)]
+    processes = [multiprocessing.Process(target=_partition_worker,
+                                         args=(i, inboxes[i], outbox, agg, max_groups, spill_dir))
+                 for i in range(workers)]
+    for process in processes:
+        process.start()
+
+    outputs = {}                                          # worker index -> its output
+    try:
+        buffers = [[] for _ in range(workers)]
+        for pair in pairs:
+            target = hash(pair[0]) % workers              # same key -> same partition
+            buffers[target].append(pair)
+            if len(buffers[target]) >= batch:
+                _send(inboxes[target], buffers[target], processes[target], outbox, processes, outputs)
+                buffers[target] = []
+        for i, buffered in enumerate(buffers):
+            if buffered:
+                _send(inboxes[i], buffered, processes[i], outbox, processes, outputs)
+            _send(inboxes[i], None, processes[i], outbox, processes, outputs)
+
+        while len(outputs) < workers:                     # read BEFORE join()
+            _receive(outbox, processes, outputs)
+        for process in processes:
+            process.join()
+
+        # Partitions never share a key, so merging = passing each one through
+        for i in range(workers):
+            yield from _results(*outputs.pop(i))
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()                       # an error or early stop
+        for kind, payload in outputs.values():            # partitions never read
+            if kind == "file":
+                os.remove(payload)
+
+
+def group_by_loop(records, key, value, agg):
+    """The dictionary.py way, one record at a time (for the benchmark)"""
+    start, step, _, finish = AGGREGATES[agg]
+    groups = {}
+    for r in records:
+        k = r[key]
+        groups[k] = step(groups[k], r[value]) if k in groups else start(r[value])
+    return {k: finish(s) for k, s in groups.items()}
+
+
+# -----------------------------------------------------------------------------
+# 4. DEMO & BENCHMARK
+# -----------------------------------------------------------------------------
+if __name__ == "__main__":
+    students = [
+        {"name": "Alice", "grade": "A", "score": 95},
+        {"name": "Bob", "grade": "B", "score": 87},
+        {"name": "Charlie", "grade": "A", "score": 91},
+    ]
+    print(dict(group_by(students, "grade", "name")))                 # {'A': ['Alice', 'Charlie'], 'B': ['Bob']}
+    print(dict(group_by(students, "grade", agg="count")))            # {'A': 2, 'B': 1}
+    print(dict(group_by(students, "grade", "score", agg="mean")))    # {'A': 93.0, 'B': 87.0}
+    print(dict(group_by(students, "grade", "name", agg="set", workers=2)))
+    print(list(group_by(students, "grade", "score", agg="sum", max_groups=1)))  # spilled: sorted keys
+    print(dict(group_by((s for s in students), "grade", agg="count", workers=2)))  # any iterable
+
+    rng = random.Random(3)
+    n_orders, n_shops = 300_000, 50_000
+    orders = [{"shop": f"shop{rng.randrange(n_shops)}", "cups": rng.randint(1, 6)}
+              for _ in range(n_orders)]
+
+    print(f"\n=== Benchmark: mean cups per shop, {n_orders:,} orders, ~{n_shops:,} shops ===")
+    start = time.perf_counter()
+    expected = group_by_loop(orders, "shop", "cups", "mean")
+    print(f"Plain dict loop:            {time.perf_counter() - start:.3f}s")
+
+    for label, options in (("group_by, 1 process", {}),
+                           ("group_by, 2 processes", {"workers": 2}),
+                           ("spill, max_groups=5,000", {"max_groups": 5_000})):
+        start = time.perf_counter()
+        result = dict(group_by(orders, "shop", "cups", agg="mean", **options))
+        elapsed = time.perf_counter() - start
+        assert result.keys() == expected.keys()
+        assert all(abs(result[k] - expected[k]) < 1e-9 for k in expected)
+        print(f"{label + ':':<27} {elapsed:.3f}s")
+
+# -----------------------------------------------------------------------------
+# 5. KEY POINTS TO REMEMBER
+# -----------------------------------------------------------------------------
+# - Every aggregate is start / step / merge / finish; mean keeps (sum, count)
+# - Partition by hash(key): one key never ends up in two workers, so the
+#   workers' results can simply be concatenated
+# - Too many keys for memory? Write SORTED partial results to disk, then
+#   heapq.merge the files and combine equal keys with itertools.groupby
+# - Pre-aggregating before spilling writes one entry per key, not per record
+# - Stream the input: a generator in, batches through bounded queues out, so
+#   memory follows the number of GROUPS (or max_groups), not of records
+# - Clean up temp files in `finally`, even if the caller stops iterating early
+# - Send a worker's exception back to the parent, and never block forever on a
+#   queue whose other end may be dead (timeouts + is_alive())
+# - Worker processes pay to pickle the data both ways - they only win when the
+#   per-record work is bigger than that cost (and you have spare CPU cores)
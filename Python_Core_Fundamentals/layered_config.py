@@ -0,0 +1,242 @@
+# =============================================================================
+# LAYERED CONFIG - Merging settings without building a new dict every time
+# =============================================================================
+# dictionary.py section 10 merges two dicts into a NEW dict:
+#
+#   merged = {**defaults, **custom}      # or defaults | custom
+#
+# Options for one order come from several layers:
+#   global -> shop -> customer -> order   (later layers win)
+# Merging them with | on EVERY request copies every key every time.
+#
+# LayeredConfig is a view over the layers instead:
+#   - reads look through the layers; merged Layer objects are CACHED, plain
+#     dicts are read live (they can't report changes, so they're never copied)
+#   - writes go to the TOP layer (write-through), like collections.ChainMap
+#   - changing any layer throws away only the caches that used it
+#   - new_child(layer) stacks a small per-request layer on a cached base
+
+import time
+import weakref
+from collections import ChainMap
+from collections.abc import MutableMapping
+
+_MISSING = object()
+
+
+# -----------------------------------------------------------------------------
+# 1. LAYER - a dict that tells its views when it changes
+# -----------------------------------------------------------------------------
+class Layer(dict):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._views = []                  # weak references to LayeredConfigs using us
+
+    def _watch(self, view):
+        # The callback drops the reference once the view is garbage collected
+        self._views.append(weakref.ref(view, self._views.remove))
+
+    def _changed(self):
+        for ref in self._views:
+            view = ref()
+            if view is not None:
+                view._sources = None
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._changed()
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._changed()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def clear(self):
+        super().clear()
+        self._changed()
+
+
+# -----------------------------------------------------------------------------
+# 2. LAYEREDCONFIG - cached reads, write-through to the top layer
+# -----------------------------------------------------------------------------
+class LayeredConfig(MutableMapping):
+    """LayeredConfig(order, customer, shop, global_) - FIRST layer wins,
+    the same order as ChainMap. Layers are used as given, never copied:
+    runs of Layer objects are merged and cached, plain dicts are read live."""
+
+    def __init__(self, *layers, parent=None):
+        self.layers = list(layers) or [{}]
+        self.parent = parent
+        self._sources = None
+        for layer in self.layers:
+            if isinstance(layer, Layer):
+                layer._watch(self)
+
+    def new_child(self, layer=None):
+        """Put one more layer on top. The child reads its own layer, then
+        this config's cached merge - nothing is copied"""
+        return LayeredConfig(layer if layer is not None else {}, parent=self)
+
+    def _build(self):
+        """The dicts a read looks in, top first (cached until a Layer changes):
+        each run of 2+ Layers becomes one merged dict, anything else is used as is"""
+        sources, run = [], []
+        for layer in self.layers + [None]:               # None ends the last run
+            if isinstance(layer, Layer):
+                run.append(layer)
+                continue
+            if len(run) == 1:
+                sources.append(run[0])
+            elif run:
+                merged = {}
+                for older in reversed(run):
+                    merged.update(older)
+                sources.append(merged)
+            run = []
+            if layer is not None:
+                sources.append(layer)                    # plain dict: read it live
+        self._sources = sources
+        return sources
+
+    # --- reads ---
+    def __getitem__(self, key):
+        sources = self._sources
+        for source in (sources if sources is not None else self._build()):
+            value = source.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+        if self.parent is None:
+            raise KeyError(key)
+        return self.parent[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        sources = self._sources if self._sources is not None else self._build()
+        return any(key in source for source in sources) or \
+            (self.parent is not None and key in self.parent)
+
+    def to_dict(self):
+        """Everything merged into a plain dict (a copy you may change freely)"""
+        merged = self.parent.to_dict() if self.parent is not None else {}
+        for source in reversed(self._sources if self._sources is not None else self._build()):
+            merged.update(source)
+        return merged
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __len__(self):
+        return len(self.to_dict())
+
+    # --- writes: always the top layer, lower layers are never touched ---
+    def __setitem__(self, key, value):
+        self.layers[0][key] = value
+
+    def __delitem__(self, key):
+        del self.layers[0][key]              # KeyError if only a lower layer has it
+
+    def __repr__(self):
+        return f"LayeredConfig({self.to_dict()!r})"
+
+
+# -----------------------------------------------------------------------------
+# 3. DEMO
+# -----------------------------------------------------------------------------
+defaults = Layer(color="blue", size="medium", price=10)
+custom = Layer(color="red", quantity=5)
+
+config = LayeredConfig(custom, defaults)
+print(config["color"], config["size"])          # red medium - no new dict built
+config["size"] = "large"                         # written to `custom`, defaults untouched
+print(custom, defaults["size"])                  # {'color': 'red', 'quantity': 5, 'size': 'large'} medium
+defaults["price"] = 12                           # mutating a layer clears the cache
+print(config["price"])                           # 12
+order = config.new_child({"quantity": 2})
+print(order["quantity"], order["color"])         # 2 red
+print(order.to_dict() == defaults | custom | {"quantity": 2})   # True
+
+order_dict, shop_dict = {"milk": "oat"}, {"milk": "full", "sugar": 1}
+plain = LayeredConfig(order_dict, shop_dict)     # plain dicts: used as is, read live
+plain["sugar"] = 0                               # writes go into order_dict itself
+shop_dict["size"] = "small"                      # seen right away - nothing was copied
+print(order_dict, plain["size"])                 # {'milk': 'oat', 'sugar': 0} small
+
+
+# -----------------------------------------------------------------------------
+# 4. BENCHMARK - per-request option resolution over 4 layers
+# -----------------------------------------------------------------------------
+def benchmark(requests=50_000, reads_per_request=10):
+    global_ = Layer({f"option{i}": i for i in range(300)})
+    shop = Layer({f"option{i}": "shop" for i in range(0, 300, 5)})
+    customer = Layer({f"option{i}": "customer" for i in range(0, 300, 30)})
+    orders = [{"option1": n, "option7": n} for n in range(100)]
+    wanted = [f"option{i * 29 % 300}" for i in range(reads_per_request)]
+
+    print(f"\n=== Benchmark: {requests:,} requests, 4 layers, {reads_per_request} reads each ===")
+
+    start = time.perf_counter()
+    for n in range(requests):
+        merged = global_ | shop | customer | orders[n % 100]
+        for key in wanted:
+            merged[key]
+    piped = time.perf_counter() - start
+    print(f"global | shop | customer | order:  {piped:.3f}s")
+
+    start = time.perf_counter()
+    for n in range(requests):
+        chain = ChainMap(orders[n % 100], customer, shop, global_)
+        for key in wanted:
+            chain[key]
+    print(f"ChainMap (no cache):               {time.perf_counter() - start:.3f}s")
+
+    base = LayeredConfig(customer, shop, global_)
+    start = time.perf_counter()
+    for n in range(requests):
+        if n % 10_000 == 0:
+            shop["option0"] = n                  # occasional change -> cache rebuilt
+        config = base.new_child(orders[n % 100])
+        for key in wanted:
+            config[key]
+    layered = time.perf_counter() - start
+    print(f"LayeredConfig.new_child:           {layered:.3f}s ({piped / layered:.1f}x faster than |)")
+
+benchmark()
+
+# -----------------------------------------------------------------------------
+# 5. KEY POINTS TO REMEMBER
+# -----------------------------------------------------------------------------
+# - a | b and {**a, **b} copy EVERY key of EVERY dict, every time
+# - A layered view reads through the layers instead of copying them
+# - Cache the merged lower layers; per-request layers go on top (new_child)
+# - Writes go to the top layer only, so shared defaults are never changed
+# - A cache must be cleared when its source changes: Layer tells its views
+#   (weak references, so finished requests don't keep views alive)
+# - Plain dicts don't report changes, so they are never cached or copied:
+#   they're read live (correct, one extra lookup); wrap hot shared layers in Layer
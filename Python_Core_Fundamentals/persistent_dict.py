@@ -0,0 +1,375 @@
+# =============================================================================
+# PERSISTENT DICT - Cheap snapshots instead of copy.deepcopy
+# =============================================================================
+# dictionary.py section 9 gets an independent copy with:
+#
+#   deep = copy.deepcopy(original)       # copies EVERYTHING: O(size) each time
+#
+# A persistent dict never changes in place. set() returns a NEW dict that
+# shares almost all of its memory with the old one, so:
+#   - a snapshot is just keeping a reference to the current version: O(1)
+#   - an update copies only the path from the root to the key: O(log n)
+#
+# Inside it is a HAMT (hash array mapped trie): the key's hash is read
+# 5 bits at a time, each 5 bits picks one of 32 branches, and a bitmap
+# records which branches exist so nodes only store what they use.
+#
+# Values are frozen on the way in, so no snapshot can change behind your
+# back: dicts become PersistentDicts, lists become read-only tuples, sets
+# become frozensets (all the way down). to_dict() hands back fresh dicts,
+# lists and sets. Objects of your own classes are NOT copied - keep those
+# immutable yourself.
+
+import copy
+import random
+import sys
+import time
+from collections.abc import Mapping
+
+BITS = 5                          # 2**5 = 32 branches per node
+MASK = (1 << BITS) - 1
+HASH_BITS = 64
+
+
+def _hash(key):
+    return hash(key) & ((1 << HASH_BITS) - 1)
+
+
+def _position(bitmap, bit):
+    return (bitmap & (bit - 1)).bit_count()   # how many branches come before this one
+
+
+# -----------------------------------------------------------------------------
+# 1. NODES - entries are (key, value) tuples or child nodes
+# -----------------------------------------------------------------------------
+class _Node:
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap, entries):
+        self.bitmap = bitmap
+        self.entries = entries            # tuple, never modified after creation
+
+
+class _Collision:
+    """Keys whose 64 hash bits are ALL equal: just a small list of pairs"""
+    __slots__ = ("hash", "entries")
+
+    def __init__(self, hash_, entries):
+        self.hash = hash_
+        self.entries = entries
+
+
+def _pair(entry1, hash1, entry2, hash2, shift):
+    """Smallest subtree holding two leaves that ended up in the same branch"""
+    if shift >= HASH_BITS:
+        return _Collision(hash1, (entry1, entry2))
+    bit1 = 1 << ((hash1 >> shift) & MASK)
+    bit2 = 1 << ((hash2 >> shift) & MASK)
+    if bit1 == bit2:
+        return _Node(bit1, (_pair(entry1, hash1, entry2, hash2, shift + BITS),))
+    entries = (entry1, entry2) if bit1 < bit2 else (entry2, entry1)
+    return _Node(bit1 | bit2, entries)
+
+
+def _get(node, h, key, default):
+    shift = 0
+    while True:
+        if type(node) is _Collision:
+            for k, v in node.entries:
+                if k == key:
+                    return v
+            return default
+        bit = 1 << ((h >> shift) & MASK)
+        if not node.bitmap & bit:
+            return default
+        entry = node.entries[_position(node.bitmap, bit)]
+        if type(entry) is tuple:
+            return entry[1] if entry[0] is key or entry[0] == key else default
+        node = entry
+        shift += BITS
+
+
+def _set(node, h, shift, key, value):
+    """Returns (new node, True if the key is new). Unchanged -> same node back"""
+    if type(node) is _Collision:
+        for i, (k, v) in enumerate(node.entries):
+            if k == key:
+                if v is value:
+                    return node, False
+                return _Collision(node.hash, node.entries[:i] + ((key, value),) + node.entries[i + 1:]), False
+        return _Collision(node.hash, node.entries + ((key, value),)), True
+
+    bit = 1 << ((h >> shift) & MASK)
+    i = _position(node.bitmap, bit)
+    entries = node.entries
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, entries[:i] + ((key, value),) + entries[i:]), True
+
+    entry = entries[i]
+    if type(entry) is tuple:
+        if entry[0] is key or entry[0] == key:
+            if entry[1] is value:
+                return node, False
+            child, added = (key, value), False
+        else:
+            child, added = _pair(entry, _hash(entry[0]), (key, value), h, shift + BITS), True
+    else:
+        child, added = _set(entry, h, shift + BITS, key, value)
+        if child is entry:
+            return node, False
+    return _Node(node.bitmap, entries[:i] + (child,) + entries[i + 1:]), added
+
+
+def _delete(node, h, shift, key):
+    """Returns the new node, a lone (key, value) leaf for the parent to keep,
+    None if nothing is left, or the SAME node if the key wasn't there"""
+    if type(node) is _Collision:
+        left = tuple(e for e in node.entries if e[0] != key)
+        if len(left) == len(node.entries):
+            return node
+        return left[0] if len(left) == 1 else _Collision(node.hash, left)
+
+    bit = 1 << ((h >> shift) & MASK)
+    if not node.bitmap & bit:
+        return node
+    i = _position(node.bitmap, bit)
+    entries = node.entries
+    entry = entries[i]
+    if type(entry) is tuple:
+        if entry[0] != key:
+            return node
+        child = None
+    else:
+        child = _delete(entry, h, shift + BITS, key)
+        if child is entry:
+            return node
+
+    if child is None:
+        if len(entries) == 1:
+            return None
+        remaining = entries[:i] + entries[i + 1:]
+        if len(remaining) == 1 and type(remaining[0]) is tuple and shift:
+            return remaining[0]               # pull a lonely leaf up a level
+        return _Node(node.bitmap & ~bit, remaining)
+    if type(child) is tuple and len(entries) == 1 and shift:
+        return child
+    return _Node(node.bitmap, entries[:i] + (child,) + entries[i + 1:])
+
+
+_EMPTY = _Node(0, ())
+
+
+# -----------------------------------------------------------------------------
+# 2. FREEZING VALUES - so a snapshot can't share a mutable list or set
+# -----------------------------------------------------------------------------
+class _FrozenList(tuple):
+    """A list stored in a PersistentDict; to_dict() turns it back into a list"""
+    __slots__ = ()
+
+
+class _FrozenSet(frozenset):
+    """A set stored in a PersistentDict; to_dict() turns it back into a set"""
+    __slots__ = ()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return PersistentDict(value)
+    if isinstance(value, list):
+        return _FrozenList(map(_freeze, value))
+    if isinstance(value, set):                   # a frozenset is already safe
+        return _FrozenSet(map(_freeze, value))
+    if type(value) is tuple:
+        return tuple(map(_freeze, value))        # a tuple can still hold a list
+    return value
+
+
+def _thaw(value):
+    if isinstance(value, PersistentDict):
+        return value.to_dict()
+    if isinstance(value, _FrozenList):
+        return list(map(_thaw, value))
+    if isinstance(value, _FrozenSet):
+        return set(map(_thaw, value))
+    if type(value) is tuple:
+        return tuple(map(_thaw, value))
+    return value
+
+
+# -----------------------------------------------------------------------------
+# 3. PERSISTENTDICT - a read-only Mapping whose "changes" return new versions
+# -----------------------------------------------------------------------------
+class PersistentDict(Mapping):
+    __slots__ = ("_root", "_len")
+
+    def __init__(self, mapping=(), **kwargs):
+        self._root, self._len = _EMPTY, 0
+        items = mapping.items() if isinstance(mapping, Mapping) else mapping
+        for key, value in list(items) + list(kwargs.items()):
+            self._root, added = _set(self._root, _hash(key), 0, key, _freeze(value))
+            self._len += added
+
+    @classmethod
+    def _make(cls, root, length):
+        new = cls.__new__(cls)
+        new._root, new._len = root, length
+        return new
+
+    @classmethod
+    def from_dict(cls, mapping):
+        """Nested dicts become nested PersistentDicts (lists/sets are frozen too)"""
+        return cls(mapping)
+
+    # --- reading (Mapping gives keys/items/values/== on top of these) ---
+    def __getitem__(self, key):
+        value = _get(self._root, _hash(key), key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        return _get(self._root, _hash(key), key, default)
+
+    def __contains__(self, key):
+        return _get(self._root, _hash(key), key, _MISSING) is not _MISSING
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        stack = [self._root]
+        while stack:
+            for entry in stack.pop().entries:
+                if type(entry) is tuple:
+                    yield entry[0]
+                else:
+                    stack.append(entry)
+
+    def __repr__(self):
+        return f"PersistentDict({dict(self.items())!r})"
+
+    # --- "changing" = building a new version ---
+    def set(self, key, value):
+        root, added = _set(self._root, _hash(key), 0, key, _freeze(value))
+        return self if root is self._root else self._make(root, self._len + added)
+
+    def delete(self, key):
+        root = _delete(self._root, _hash(key), 0, key)
+        if root is self._root:
+            raise KeyError(key)
+        return self._make(_EMPTY if root is None else root, self._len - 1)
+
+    def update(self, mapping):
+        new = self
+        for key, value in mapping.items():
+            new = new.set(key, value)
+        return new
+
+    def get_in(self, path, default=None):
+        node = self
+        for key in path:
+            if not isinstance(node, Mapping) or key not in node:
+                return default
+            node = node[key]
+        return node
+
+    def set_in(self, path, value):
+        """config.set_in(("shop7", "sugar"), 2): copies one path per level"""
+        key, *rest = path
+        if rest:
+            child = self.get(key)
+            if child is None:
+                child = PersistentDict()
+            value = child.set_in(rest, value)
+        return self.set(key, value)
+
+    def to_dict(self):
+        """Plain (mutable) nested dicts, lists and sets again - fresh copies"""
+        return {k: _thaw(v) for k, v in self.items()}
+
+
+_MISSING = object()
+
+
+# -----------------------------------------------------------------------------
+# 4. DEMO
+# -----------------------------------------------------------------------------
+original = PersistentDict.from_dict({"a": 1, "b": {"nested": 2}})
+snapshot = original                                  # "copying" = keeping a reference
+changed = original.set_in(("b", "nested"), 999)
+
+print(snapshot.get_in(("b", "nested")))              # 2   - old version untouched
+print(changed.get_in(("b", "nested")))               # 999
+print(changed["a"] is original["a"])                 # True - unchanged parts are shared
+print(changed.to_dict())                             # {'a': 1, 'b': {'nested': 999}}
+print(len(changed.delete("a")), len(changed))        # 1 2
+
+toppings = ["ginger"]
+menu = PersistentDict.from_dict({"masala": {"spices": toppings}})
+toppings.append("clove")                             # the original list changes...
+print(menu.to_dict())                                # {'masala': {'spices': ['ginger']}} - ...the snapshot doesn't
+
+
+# -----------------------------------------------------------------------------
+# 5. BENCHMARK - one update + one snapshot per request
+# -----------------------------------------------------------------------------
+def benchmark(n_shops=200, settings_per_shop=60, requests=200):
+    rng = random.Random(1)
+    config = {f"shop{s}": {f"setting{k}": k for k in range(settings_per_shop)}
+              for s in range(n_shops)}
+    updates = [(f"shop{rng.randrange(n_shops)}", f"setting{rng.randrange(settings_per_shop)}",
+                rng.randrange(100)) for _ in range(requests)]
+    print(f"\n=== Benchmark: {n_shops * settings_per_shop:,} settings, {requests} requests ===")
+
+    snapshots = []
+    start = time.perf_counter()
+    for shop, setting, value in updates:
+        snapshots.append(copy.deepcopy(config))       # snapshot, then change
+        config[shop][setting] = value
+    deep = time.perf_counter() - start
+
+    persistent = PersistentDict.from_dict(config)
+    versions = []
+    start = time.perf_counter()
+    for shop, setting, value in updates:
+        versions.append(persistent)                   # snapshot = keep the old version
+        persistent = persistent.set_in((shop, setting), value)
+    shared = time.perf_counter() - start
+
+    assert persistent.to_dict() == config
+    print(f"copy.deepcopy:  {deep / requests * 1e6:8.1f} µs per request")
+    print(f"PersistentDict: {shared / requests * 1e6:8.1f} µs per request ({deep / shared:.0f}x faster)")
+
+    # Memory: count the distinct node objects all versions together use
+    seen = set()
+    stack = [v._root for v in versions + [persistent]]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        for entry in node.entries:
+            if type(entry) is tuple:
+                if isinstance(entry[1], PersistentDict):
+                    stack.append(entry[1]._root)
+            else:
+                stack.append(entry)
+    one_copy = sum(sys.getsizeof(d) for d in config.values()) + sys.getsizeof(config)
+    print(f"Dicts per deepcopy snapshot: ~{one_copy / 1024:.0f} KiB x {requests} snapshots; "
+          f"all {requests + 1} persistent versions share {len(seen):,} nodes")
+
+benchmark()
+
+# -----------------------------------------------------------------------------
+# 6. KEY POINTS TO REMEMBER
+# -----------------------------------------------------------------------------
+# - deepcopy copies the whole structure every time: O(size) per snapshot
+# - A persistent dict never mutates: set() returns a NEW version
+# - New versions share every node that didn't change (structural sharing),
+#   so a snapshot is O(1) and an update copies only O(log n) small nodes
+# - HAMT: 5 hash bits per level pick a branch; a bitmap + bit_count() finds
+#   its slot, so nodes only store branches that exist
+# - Two keys with the same full hash go into a small collision node
+# - Freeze values on the way in (lists -> tuples, sets -> frozensets): a
+#   shared mutable list would let an "old version" change after the fact
+# - to_dict() converts back to normal dicts, lists and sets when you need to mutate